@@ -0,0 +1,111 @@
+"""On-disk response cache for the image-vision example scripts.
+
+Responses are stored as small JSON files keyed by a SHA-256 of the image
+bytes, model, prompt and token limit, so re-running the same analysis
+returns instantly without another API call. Images uploaded through a
+provider Files API are remembered in files.json so they are uploaded once.
+
+Environment:
+    - VISION_CACHE_DIR: cache location (default: ~/.cache/vision-skill)
+    - VISION_NO_CACHE: set to any non-empty value to bypass the cache
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+
+# Uploaded file IDs (files.json) are reused for this many seconds
+FILE_ID_TTL = 7 * 24 * 3600
+
+
+def _cache_dir() -> Path:
+    """Return the cache directory (not created until the first write)."""
+    override = os.environ.get("VISION_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "vision-skill"
+
+
+def _enabled() -> bool:
+    return not os.environ.get("VISION_NO_CACHE")
+
+
+def cache_key(img_bytes: bytes, model: str, prompt: str, max_tokens) -> str:
+    """Deterministic cache key for an analysis request."""
+    h = hashlib.sha256(img_bytes)
+    for part in (model, prompt, str(max_tokens)):
+        h.update(b"|")
+        h.update(part.encode("utf-8"))
+    return h.hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """Return the cached response text for ``key``, or None on a miss."""
+    if not _enabled():
+        return None
+    try:
+        with open(_cache_dir() / f"{key}.json", encoding="utf-8") as f:
+            return json.load(f)["text"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _write_json(name: str, obj) -> None:
+    """Atomically write ``obj`` to ``name`` in the cache dir (failures ignored)."""
+    cache_dir = _cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(obj, f)
+            os.replace(tmp_path, cache_dir / name)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # The cache is an optimization - never fail an analysis over it
+        pass
+
+
+def put(key: str, text: str) -> None:
+    """Store response text for ``key`` (atomic; failures are ignored)."""
+    if not _enabled() or text is None:
+        return
+    _write_json(f"{key}.json", {"text": text})
+
+
+def _load_file_ids() -> dict:
+    try:
+        with open(_cache_dir() / "files.json", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def get_file_id(content_hash: str, provider: str) -> Optional[str]:
+    """Return a still-fresh uploaded file ID for this image, if any."""
+    if not _enabled():
+        return None
+    entry = _load_file_ids().get(f"{provider}:{content_hash}")
+    if not entry or time.time() - entry.get("uploaded", 0) > FILE_ID_TTL:
+        return None
+    return entry.get("file_id")
+
+
+def put_file_id(content_hash: str, provider: str, file_id: str) -> None:
+    """Remember the uploaded file ID for this image."""
+    if not _enabled():
+        return
+    now = time.time()
+    entries = {
+        key: entry for key, entry in _load_file_ids().items()
+        if now - entry.get("uploaded", 0) <= FILE_ID_TTL
+    }
+    entries[f"{provider}:{content_hash}"] = {"file_id": file_id, "uploaded": now}
+    _write_json("files.json", entries)
@@ -0,0 +1,288 @@
+"""Shared helpers for the image-vision example scripts.
+
+Keeps image loading and preprocessing in one place so every provider
+script sends the same (downscaled, re-encoded) bytes.
+
+Requires:
+    - Pillow (optional): pip install pillow
+      Without Pillow, images are sent unmodified.
+    - pybase64 (optional): pip install pybase64
+      SIMD base64 encoder; falls back to the standard library's C encoder.
+    - h2 (optional): pip install h2
+      Enables HTTP/2 for the Anthropic/OpenAI/Azure clients.
+"""
+
+import argparse
+import asyncio
+import binascii
+import hashlib
+import importlib.util
+import io
+import mmap
+import random
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional - fall back to raw bytes
+    Image = None
+
+try:
+    import pybase64
+except ImportError:  # pybase64 is optional - fall back to stdlib base64
+    pybase64 = None
+
+
+# Longest edge (px) sent to providers. Larger images are tiled into many
+# vision tokens without improving analysis quality.
+DEFAULT_MAX_DIM = 1568
+
+# Images at or below this size lose nothing with OpenAI's "low" detail mode
+LOW_DETAIL_MAX_DIM = 512
+
+# Delay between the first launches of a concurrent batch, roughly one
+# image's preprocessing time, so encode and network phases overlap
+DEFAULT_STAGGER = 0.05
+
+# HTTP/2 lets concurrent requests share one connection; httpx needs the
+# optional h2 package for it (pip install h2)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# How many recently sent images to remember for reuse statistics
+_RECENT_IMAGES_MAX = 64
+
+# Formats Pillow will try to decode; restricting the list also stops it
+# probing every plugin it ships with
+_FORMATS = ("JPEG", "PNG", "GIF", "WEBP", "BMP", "TIFF")
+
+
+def sniff(head: bytes) -> str:
+    """Detect an image media type from its first 12 bytes.
+
+    Works regardless of file extension (misnamed files, ``.jpeg.bak``,
+    no extension). Unknown formats default to "image/jpeg".
+    """
+    if head[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if head[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/jpeg"
+
+
+def _read_raw(image_path: str) -> tuple[bytes, str]:
+    """Read an image unmodified, detecting media type from its header."""
+    with open(image_path, "rb") as f:
+        data = f.read()
+    return data, sniff(data[:12])
+
+
+def parse_crop(value: str) -> tuple[int, int, int, int]:
+    """Parse an ``X,Y,W,H`` command-line crop region."""
+    try:
+        x, y, w, h = (int(part) for part in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"crop must be X,Y,W,H integers, got {value!r}")
+    if w <= 0 or h <= 0:
+        raise argparse.ArgumentTypeError("crop width and height must be positive")
+    return x, y, w, h
+
+
+def preprocess_image(image_path: str, max_dim: int = DEFAULT_MAX_DIM,
+                     quality: int = 85,
+                     crop: Optional[tuple[int, int, int, int]] = None) -> tuple[bytes, str]:
+    """Load an image, crop and downscale it, and re-encode as JPEG.
+
+    Cropping to the region a prompt is about is the biggest token saving
+    available: vision cost scales with image area.
+
+    Args:
+        image_path: Path to image file (JPEG, PNG, GIF, WEBP)
+        max_dim: Maximum length of the longest edge in pixels
+        quality: JPEG quality used when re-encoding
+        crop: Optional (x, y, width, height) region to keep
+
+    Returns:
+        Tuple of (image bytes, media type)
+
+    Raises:
+        FileNotFoundError: If the image does not exist
+        RuntimeError: If the image cannot be read or decoded, or cropping
+            is requested without Pillow installed
+    """
+    if crop is not None and Image is None:
+        raise RuntimeError("Cropping requires Pillow: pip install pillow")
+
+    try:
+        if Image is None:
+            return _read_raw(image_path)
+
+        # Decode straight from a read-only mapping: pages are faulted in as
+        # Pillow reads them instead of copying the whole file into a bytes
+        with open(image_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                Image.open(mm, formats=_FORMATS) as img:
+            # Small JPEGs are already as cheap as they get - don't recompress
+            if crop is None and img.format == "JPEG" and max(img.size) <= max_dim:
+                return mm[:], "image/jpeg"
+
+            if crop is not None:
+                x, y, w, h = crop
+                img = img.crop((x, y, x + w, y + h))
+
+            img.thumbnail((max_dim, max_dim), Image.LANCZOS)
+
+            if img.mode in ("RGBA", "LA", "P"):
+                # Flatten transparency onto white rather than JPEG's black
+                img = img.convert("RGBA")
+                background = Image.new("RGB", img.size, (255, 255, 255))
+                background.paste(img, mask=img.getchannel("A"))
+                img = background
+            elif img.mode != "RGB":
+                img = img.convert("RGB")
+
+            buf = io.BytesIO()
+            img.save(buf, format="JPEG", quality=quality, optimize=True)
+            return buf.getvalue(), "image/jpeg"
+
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Image not found: {image_path}")
+    except Exception as e:
+        raise RuntimeError(f"Failed to read image: {e}")
+
+
+def detail_hint(image_data: bytes) -> str:
+    """Pick an OpenAI ``detail`` level for already-preprocessed image bytes.
+
+    Returns "low" when the image fits in a single low-detail tile, so the
+    request is billed at the flat low-detail rate; otherwise "auto".
+    """
+    if Image is None:
+        return "auto"
+    try:
+        with Image.open(io.BytesIO(image_data)) as img:
+            if max(img.size) <= LOW_DETAIL_MAX_DIM:
+                return "low"
+    except Exception:
+        pass
+    return "auto"
+
+
+def b64encode_as_string(data: bytes) -> str:
+    """Base64-encode bytes straight to a ``str``.
+
+    Uses pybase64's SIMD encoder when installed, which also skips the
+    intermediate ``bytes`` object that ``b64encode(...).decode()`` creates.
+    Otherwise calls binascii's C encoder directly; ``base64.b64encode`` is
+    only a Python wrapper around it.
+    """
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+def build_data_uri(data: bytes, media_type: str) -> str:
+    """Build a ``data:`` URI for image bytes.
+
+    The encoded payload only lives as a temporary inside this call, so
+    callers never hold both the base64 string and the finished URI.
+    """
+    return f"data:{media_type};base64,{b64encode_as_string(data)}"
+
+
+async def gather_bounded(fn, items: list[dict], concurrency: int = 8,
+                         stagger: float = DEFAULT_STAGGER) -> list:
+    """Await ``fn(**item)`` for every item, at most ``concurrency`` at a time.
+
+    The first ``concurrency`` tasks start ``stagger`` seconds apart so they
+    don't all preprocess, encode and open connections at the same instant;
+    after that the semaphore staggers them naturally as requests finish.
+
+    Results come back in input order. A failed item yields its exception
+    object instead of aborting the rest of the batch.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(item: dict):
+        async with sem:
+            return await fn(**item)
+
+    tasks = []
+    for i, item in enumerate(items):
+        if stagger and 0 < i < concurrency:
+            await asyncio.sleep(stagger)
+        tasks.append(asyncio.create_task(one(item)))
+
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def wait_for_batch(fetch, batch_id: str, count: int,
+                         poll_interval: float = 30.0) -> list:
+    """Poll a provider Batch API job until it ends and order its results.
+
+    Args:
+        fetch: Coroutine function returning None while the batch is still
+            running, else a dict mapping custom_id to text or exception
+        batch_id: Provider batch identifier
+        count: Number of submitted items (custom_ids are "0".."count-1")
+        poll_interval: Seconds between status checks
+
+    Returns:
+        One result per submitted item, in order; failed items hold the exception
+    """
+    while (results := await fetch(batch_id)) is None:
+        await asyncio.sleep(poll_interval)
+    return [
+        results.get(str(i), RuntimeError(f"No result returned for batch item {i}"))
+        for i in range(count)
+    ]
+
+
+def backoff_delay(attempt: int, error: Optional[BaseException] = None) -> float:
+    """Seconds to wait before retrying a rate-limited request.
+
+    Honors the server's ``retry-after-ms`` / ``retry-after`` headers when the
+    SDK error carries a response, else backs off exponentially (1s, 2s, ...).
+    Up to 25% random jitter is added so concurrent clients don't retry in
+    lockstep.
+    """
+    base = 0.0
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is not None:
+        try:
+            if headers.get("retry-after-ms"):
+                base = float(headers["retry-after-ms"]) / 1000
+            elif headers.get("retry-after"):
+                base = float(headers["retry-after"])
+        except (TypeError, ValueError):
+            pass  # HTTP-date form or garbage - fall back to exponential
+    if base <= 0:
+        base = 2 ** attempt
+    return base + random.uniform(0, base * 0.25)
+
+
+_recent_images: OrderedDict = OrderedDict()
+image_reuse_stats = {"hits": 0, "misses": 0}
+
+
+def track_image_reuse(image_bytes: bytes, model: str) -> bool:
+    """Record that an image is being sent to ``model`` in this process.
+
+    Returns True when the same image went to the same model recently, i.e.
+    the provider's prompt cache is likely to serve its tokens. Counts are
+    kept in ``image_reuse_stats``.
+    """
+    key = (hashlib.sha256(image_bytes).hexdigest(), model)
+    if key in _recent_images:
+        _recent_images.move_to_end(key)
+        image_reuse_stats["hits"] += 1
+        return True
+    _recent_images[key] = None
+    if len(_recent_images) > _RECENT_IMAGES_MAX:
+        _recent_images.popitem(last=False)
+    image_reuse_stats["misses"] += 1
+    return False
@@ -0,0 +1,629 @@
+#!/usr/bin/env python3
+"""Analyze images with any supported vision provider.
+
+One provider-agnostic core (preprocess, cache, retry, batch) drives thin
+per-provider backends. The ``<provider>-vision.py`` scripts are shims that
+pick a backend and reuse everything here.
+
+Usage:
+    python vision.py --provider PROVIDER [--crop X,Y,W,H] [--max-dim N] <image_path> <prompt>
+
+Example:
+    python vision.py --provider anthropic screenshot.png "Describe this UI"
+    python vision.py --provider gemini --crop 0,0,800,600 screenshot.png "Describe the error dialog"
+
+Requires:
+    - The provider SDK: pip install anthropic | openai | google-genai
+    - The provider API key environment variable (see each backend)
+    - Pillow (optional, downscales images before upload): pip install pillow
+    - pybase64 (optional, faster base64 encoding): pip install pybase64
+    - h2 (optional, HTTP/2 connection sharing): pip install h2
+"""
+
+import argparse
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import sys
+from typing import Optional, Protocol
+
+import _cache
+from _vision_utils import (
+    DEFAULT_MAX_DIM,
+    DEFAULT_STAGGER,
+    HTTP2_AVAILABLE,
+    b64encode_as_string,
+    backoff_delay,
+    build_data_uri,
+    detail_hint,
+    gather_bounded,
+    parse_crop,
+    preprocess_image,
+    track_image_reuse,
+    wait_for_batch
+)
+
+
+MAX_TOKENS = 1024
+
+# Smallest batch worth routing through a provider Batch API
+BATCH_API_MIN_ITEMS = 8
+
+# Item keys consumed by the core; anything else is a backend option
+_CORE_KEYS = ("image_path", "prompt", "max_retries", "crop", "max_dim")
+
+
+class VisionBackend(Protocol):
+    """What the core needs from a provider.
+
+    ``call`` sends one preprocessed image and returns the response text;
+    ``classify_error`` tells the retry loop what a raised exception means.
+    Backends may also define ``submit_batch``/``fetch_batch`` to support
+    a provider Batch API.
+    """
+
+    model: str
+    max_tokens: Optional[int]
+
+    def cache_model(self, **options) -> str: ...
+
+    def classify_error(self, error: Exception) -> Optional[str]: ...
+
+    async def call(self, image_bytes: bytes, media_type: str, prompt: str,
+                   **options) -> str: ...
+
+
+class _Backend:
+    """Shared plumbing: one SDK client per event loop."""
+
+    model = ""
+    max_tokens: Optional[int] = MAX_TOKENS
+
+    def __init__(self):
+        # Reusing one client keeps its HTTP connection pool alive across
+        # calls; clients are bound to a loop, so a new one is made per
+        # asyncio.run()
+        self._client_for_loop = functools.lru_cache(maxsize=1)(self._make_client)
+
+    def _make_client(self, loop: asyncio.AbstractEventLoop):
+        raise NotImplementedError
+
+    def _client(self):
+        return self._client_for_loop(asyncio.get_running_loop())
+
+    def cache_model(self, **options) -> str:
+        """Model identifier for cache keys (options that change the answer)."""
+        return self.model
+
+
+class AnthropicBackend(_Backend):
+    """Anthropic Claude via the Messages API (ANTHROPIC_API_KEY)."""
+
+    description = "Analyze images using Anthropic Claude vision models."
+    model = "claude-sonnet-4-5"  # Latest model (September 2025)
+
+    # Beta flag for referencing images uploaded through the Files API
+    FILES_API_BETA = "files-api-2025-04-14"
+
+    def __init__(self):
+        import anthropic
+        self._sdk = anthropic
+        super().__init__()
+
+    def _make_client(self, loop):
+        api_key = os.environ.get("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+
+        return self._sdk.AsyncAnthropic(
+            api_key=api_key,
+            http_client=self._sdk.DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE)
+        )
+
+    def build_messages(self, image_bytes: bytes, media_type: str, prompt: str,
+                       file_id: Optional[str] = None) -> list[dict]:
+        """Build the Messages API payload for one image and prompt.
+
+        The image comes first and is marked cacheable, so repeated prompts
+        about the same image reuse it from Anthropic's prompt cache. With a
+        ``file_id`` the image is referenced instead of sent as base64.
+        """
+        if file_id:
+            source = {"type": "file", "file_id": file_id}
+        else:
+            source = {
+                "type": "base64",
+                "media_type": media_type,
+                "data": b64encode_as_string(image_bytes)
+            }
+
+        return [{
+            "role": "user",
+            "content": [
+                {
+                    "type": "image",
+                    "source": source,
+                    # Cache the image tokens server-side (~5 min) so follow-up
+                    # prompts about the same image skip re-processing it
+                    "cache_control": {"type": "ephemeral"}
+                },
+                {
+                    "type": "text",
+                    "text": prompt
+                }
+            ]
+        }]
+
+    async def _upload_once(self, image_bytes: bytes, media_type: str) -> str:
+        """Upload an image through the Files API, reusing earlier uploads.
+
+        File IDs are remembered by content hash in the on-disk cache, so asking
+        several questions about one image uploads its bytes once.
+        """
+        content_hash = hashlib.sha256(image_bytes).hexdigest()
+        file_id = _cache.get_file_id(content_hash, "anthropic")
+        if file_id:
+            return file_id
+
+        ext = media_type.split("/")[-1]
+        uploaded = await self._client().beta.files.upload(
+            file=(f"{content_hash[:16]}.{ext}", image_bytes, media_type),
+            betas=[self.FILES_API_BETA]
+        )
+        _cache.put_file_id(content_hash, "anthropic", uploaded.id)
+        return uploaded.id
+
+    def classify_error(self, error):
+        if isinstance(error, self._sdk.RateLimitError):
+            return "rate_limit"
+        if isinstance(error, self._sdk.APITimeoutError):
+            return "timeout"
+        if isinstance(error, self._sdk.APIError):
+            return "error"
+        return None
+
+    async def call(self, image_bytes, media_type, prompt, upload: bool = False):
+        client = self._client()
+        file_id = await self._upload_once(image_bytes, media_type) if upload else None
+        messages = self.build_messages(image_bytes, media_type, prompt, file_id)
+
+        # File references are a beta feature of the Messages API
+        messages_api = client.beta.messages if file_id else client.messages
+        extra = {"betas": [self.FILES_API_BETA]} if file_id else {}
+
+        message = await messages_api.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            timeout=60.0,  # 60-second timeout
+            messages=messages,
+            **extra
+        )
+        return message.content[0].text
+
+    async def submit_batch(self, requests: list[tuple]) -> str:
+        """Submit (image_bytes, media_type, prompt, options) tuples to the
+        Message Batches API (50% cheaper, async)."""
+        batch = await self._client().messages.batches.create(requests=[
+            {
+                "custom_id": str(i),
+                "params": {
+                    "model": self.model,
+                    "max_tokens": self.max_tokens,
+                    "messages": self.build_messages(image_bytes, media_type, prompt)
+                }
+            }
+            for i, (image_bytes, media_type, prompt, _options) in enumerate(requests)
+        ])
+        return batch.id
+
+    async def fetch_batch(self, batch_id: str) -> Optional[dict]:
+        client = self._client()
+
+        batch = await client.messages.batches.retrieve(batch_id)
+        if batch.processing_status != "ended":
+            return None
+
+        results = {}
+        async for entry in await client.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message.content[0].text
+            else:
+                results[entry.custom_id] = RuntimeError(f"Batch request {entry.result.type}")
+        return results
+
+
+class OpenAIBackend(_Backend):
+    """OpenAI GPT via Chat Completions (OPENAI_API_KEY)."""
+
+    description = "Analyze images using OpenAI GPT-4 vision models."
+    model = "gpt-5"  # Latest flagship model (2025)
+
+    def __init__(self):
+        import openai
+        self._sdk = openai
+        super().__init__()
+
+    def _make_client(self, loop):
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY environment variable not set")
+
+        return self._sdk.AsyncOpenAI(
+            api_key=api_key,
+            http_client=self._sdk.DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE)
+        )
+
+    def build_messages(self, image_bytes: bytes, media_type: str, prompt: str,
+                       detail: Optional[str] = None) -> list[dict]:
+        """Build the Chat Completions payload for one image and prompt.
+
+        The image goes before the prompt so requests about the same image share
+        a prefix, which is what OpenAI's automatic prompt caching matches on.
+        """
+        return [{
+            "role": "user",
+            "content": [
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": build_data_uri(image_bytes, media_type),
+                        "detail": detail or detail_hint(image_bytes)
+                    }
+                },
+                {
+                    "type": "text",
+                    "text": prompt
+                }
+            ]
+        }]
+
+    def _token_limit(self) -> dict:
+        return {"max_completion_tokens": self.max_tokens}  # GPT-5 uses max_completion_tokens
+
+    def cache_model(self, detail: Optional[str] = None, **options) -> str:
+        return f"{self.model}:{detail or 'auto'}"
+
+    def classify_error(self, error):
+        if isinstance(error, self._sdk.RateLimitError):
+            return "rate_limit"
+        if isinstance(error, self._sdk.APITimeoutError):
+            return "timeout"
+        if isinstance(error, self._sdk.APIError):
+            return "error"
+        return None
+
+    async def call(self, image_bytes, media_type, prompt, detail: Optional[str] = None):
+        response = await self._client().chat.completions.create(
+            model=self.model,
+            messages=self.build_messages(image_bytes, media_type, prompt, detail),
+            timeout=60.0,  # 60-second timeout
+            **self._token_limit()
+        )
+        return response.choices[0].message.content
+
+    async def submit_batch(self, requests: list[tuple]) -> str:
+        """Submit (image_bytes, media_type, prompt, options) tuples to the
+        Batch API (50% cheaper, async)."""
+        client = self._client()
+
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": self.build_messages(image_bytes, media_type, prompt,
+                                                    options.get("detail")),
+                    **self._token_limit()
+                }
+            })
+            for i, (image_bytes, media_type, prompt, options) in enumerate(requests)
+        ]
+
+        batch_file = await client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    async def fetch_batch(self, batch_id: str) -> Optional[dict]:
+        client = self._client()
+
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"Batch {batch_id} {batch.status}")
+        if batch.status != "completed":
+            return None
+
+        results = {}
+        if batch.output_file_id:
+            output = await client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                row = json.loads(line)
+                response = row.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[row["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+                else:
+                    results[row["custom_id"]] = RuntimeError(f"Batch request failed: {row.get('error') or response}")
+        return results
+
+
+class AzureBackend(OpenAIBackend):
+    """Azure OpenAI (AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT and
+    optionally AZURE_OPENAI_DEPLOYMENT, default 'gpt-4o')."""
+
+    description = "Analyze images using Azure OpenAI vision models."
+    env_help = """\
+Required environment variables:
+  AZURE_OPENAI_API_KEY
+  AZURE_OPENAI_ENDPOINT
+  AZURE_OPENAI_DEPLOYMENT (optional, defaults to 'gpt-4o')
+"""
+
+    # Azure deployments don't offer the Batch API used by OpenAIBackend
+    submit_batch = None
+    fetch_batch = None
+
+    @property
+    def model(self) -> str:
+        # Requests name the deployment, not the underlying model
+        return os.environ.get("AZURE_OPENAI_DEPLOYMENT", "gpt-4o")
+
+    def _make_client(self, loop):
+        api_key = os.environ.get("AZURE_OPENAI_API_KEY")
+        endpoint = os.environ.get("AZURE_OPENAI_ENDPOINT")
+
+        if not api_key:
+            raise ValueError("AZURE_OPENAI_API_KEY environment variable not set")
+        if not endpoint:
+            raise ValueError("AZURE_OPENAI_ENDPOINT environment variable not set")
+
+        return self._sdk.AsyncAzureOpenAI(
+            api_key=api_key,
+            api_version="2024-02-15-preview",  # Vision-enabled API version
+            azure_endpoint=endpoint,
+            http_client=self._sdk.DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE)
+        )
+
+    def _token_limit(self) -> dict:
+        return {"max_tokens": self.max_tokens}
+
+
+class GeminiBackend(_Backend):
+    """Google Gemini via google-genai (GOOGLE_API_KEY)."""
+
+    description = "Analyze images using Google Gemini vision models."
+    model = "gemini-2.5-flash"  # Latest model (2025)
+    max_tokens = None
+
+    def __init__(self):
+        from google import genai
+        from google.genai import types
+        self._genai = genai
+        self._types = types
+        super().__init__()
+
+    def _make_client(self, loop):
+        api_key = os.environ.get("GOOGLE_API_KEY")
+        if not api_key:
+            raise ValueError("GOOGLE_API_KEY environment variable not set")
+
+        return self._genai.Client(api_key=api_key)
+
+    def classify_error(self, error):
+        # google-genai has no stable exception hierarchy - match the message
+        error_msg = str(error).lower()
+        if "rate" in error_msg or "quota" in error_msg or "429" in error_msg:
+            return "rate_limit"
+        if "timeout" in error_msg or "deadline" in error_msg:
+            return "timeout"
+        return "error"
+
+    async def call(self, image_bytes, media_type, prompt):
+        # Gemini takes raw bytes, no base64
+        response = await self._client().aio.models.generate_content(
+            model=self.model,
+            contents=[
+                prompt,
+                self._types.Part.from_bytes(data=image_bytes, mime_type=media_type)
+            ]
+        )
+        return response.text
+
+
+BACKENDS = {
+    "anthropic": AnthropicBackend,
+    "openai": OpenAIBackend,
+    "azure": AzureBackend,
+    "gemini": GeminiBackend,
+}
+
+
+async def analyze_image(image_path: str, prompt: str, backend: VisionBackend, *,
+                        max_retries: int = 2,
+                        crop: Optional[tuple[int, int, int, int]] = None,
+                        max_dim: int = DEFAULT_MAX_DIM,
+                        **options) -> str:
+    """Analyze an image with the given backend.
+
+    Args:
+        image_path: Path to image file (JPEG, PNG, GIF, WEBP)
+        prompt: Question or instruction about the image
+        backend: Provider backend, e.g. ``AnthropicBackend()``
+        max_retries: Attempts before giving up on rate limits/timeouts
+        crop: Optional (x, y, width, height) region to analyze; cropping
+            to the area the prompt is about cuts vision tokens the most
+        max_dim: Longest edge in pixels sent to the API
+        **options: Backend options, e.g. ``detail`` (OpenAI/Azure) or
+            ``upload`` (Anthropic Files API)
+
+    Returns:
+        The model's text analysis of the image
+    """
+    # Downscale and re-encode image
+    image_bytes, media_type = await asyncio.to_thread(
+        preprocess_image, image_path, max_dim, crop=crop
+    )
+
+    # Return a cached response for an identical request
+    cache_key = _cache.cache_key(image_bytes, backend.cache_model(**options),
+                                 prompt, backend.max_tokens)
+    cached = _cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    track_image_reuse(image_bytes, backend.model)
+
+    for attempt in range(max_retries):
+        try:
+            result = await backend.call(image_bytes, media_type, prompt, **options)
+            _cache.put(cache_key, result)
+            return result
+
+        except Exception as e:
+            kind = backend.classify_error(e)
+            if kind is None:
+                raise
+
+            if kind == "rate_limit":
+                if attempt < max_retries - 1:
+                    wait_time = backoff_delay(attempt, e)  # Retry-After or 1s, 2s, plus jitter
+                    print(f"Rate limited, waiting {wait_time:.1f}s before retry...", file=sys.stderr)
+                    await asyncio.sleep(wait_time)
+                else:
+                    raise RuntimeError(f"Rate limit exceeded after {max_retries} attempts: {e}")
+
+            elif kind == "timeout":
+                if attempt < max_retries - 1:
+                    print(f"Request timed out, retrying (attempt {attempt + 2}/{max_retries})...", file=sys.stderr)
+                    await asyncio.sleep(2)
+                else:
+                    raise RuntimeError(f"Request timed out after {max_retries} attempts: {e}")
+
+            else:
+                # Other API errors - don't retry
+                raise RuntimeError(f"API error: {e}")
+
+
+def analyze_image_sync(image_path: str, prompt: str, backend: VisionBackend,
+                       **kwargs) -> str:
+    """Synchronous wrapper around :func:`analyze_image`."""
+    return asyncio.run(analyze_image(image_path, prompt, backend, **kwargs))
+
+
+async def submit_batch(items: list[dict], backend: VisionBackend) -> str:
+    """Submit images to the backend's Batch API (50% cheaper, async).
+
+    Args:
+        items: Dicts with ``image_path`` and ``prompt`` keys
+        backend: A backend with Batch API support
+
+    Returns:
+        Batch ID to pass to fetch_batch
+    """
+    requests = []
+    for item in items:
+        image_bytes, media_type = await asyncio.to_thread(
+            preprocess_image, item["image_path"],
+            item.get("max_dim", DEFAULT_MAX_DIM), crop=item.get("crop")
+        )
+        options = {k: v for k, v in item.items() if k not in _CORE_KEYS}
+        requests.append((image_bytes, media_type, item["prompt"], options))
+    return await backend.submit_batch(requests)
+
+
+async def fetch_batch(batch_id: str, backend: VisionBackend) -> Optional[dict]:
+    """Fetch Batch API results.
+
+    Returns:
+        None while the batch is still processing, else a dict mapping each
+        custom_id to its text or to a RuntimeError for failed requests
+    """
+    return await backend.fetch_batch(batch_id)
+
+
+async def batch_analyze(items: list[dict], backend: VisionBackend, concurrency: int = 8,
+                        batch: bool = False, stagger: float = DEFAULT_STAGGER) -> list:
+    """Analyze many images concurrently.
+
+    Args:
+        items: Keyword arguments for analyze_image, e.g.
+            ``{"image_path": "a.png", "prompt": "Describe this UI"}``
+        backend: Provider backend
+        concurrency: Maximum number of requests in flight
+        batch: Use the provider Batch API for large offline workloads
+            (at least BATCH_API_MIN_ITEMS items) when the backend has one;
+            may take minutes to hours
+        stagger: Seconds between the first launches, so image encoding
+            and uploads overlap instead of all happening at once
+
+    Returns:
+        One result per item, in order; failed items hold the exception
+    """
+    if batch and getattr(backend, "submit_batch", None) and len(items) >= BATCH_API_MIN_ITEMS:
+        batch_id = await submit_batch(items, backend)
+        print(f"Submitted batch {batch_id}, waiting for results...", file=sys.stderr)
+        return await wait_for_batch(backend.fetch_batch, batch_id, len(items))
+
+    return await gather_bounded(functools.partial(analyze_image, backend=backend),
+                                items, concurrency, stagger)
+
+
+def main(backend: Optional[VisionBackend] = None, argv: Optional[list[str]] = None) -> None:
+    """Command-line entry point; with no backend, ``--provider`` picks one."""
+    prog = os.path.basename(sys.argv[0])
+    provider = "" if backend else "--provider anthropic "
+    parser = argparse.ArgumentParser(
+        description=getattr(backend, "description", "Analyze images with a vision model."),
+        epilog=f"""\
+Example:
+  python {prog} {provider}screenshot.png "Describe this UI"
+  python {prog} {provider}--crop 0,0,800,600 screenshot.png "Describe the error dialog"
+""" + ("\n" + backend.env_help if getattr(backend, "env_help", None) else ""),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    if backend is None:
+        parser.add_argument("--provider", choices=sorted(BACKENDS), required=True,
+                            help="Vision provider to use")
+    parser.add_argument("image_path", help="Path to image file (JPEG, PNG, GIF, WEBP)")
+    parser.add_argument("prompt", nargs="+", help="Question or instruction about the image")
+    parser.add_argument("--crop", type=parse_crop, metavar="X,Y,W,H",
+                        help="Only send this region of the image")
+    parser.add_argument("--max-dim", type=int, default=DEFAULT_MAX_DIM,
+                        help=f"Longest edge in pixels sent to the API (default: {DEFAULT_MAX_DIM})")
+    if backend is None or isinstance(backend, OpenAIBackend):
+        parser.add_argument("--detail", choices=["low", "high", "auto"],
+                            help="Vision detail level (OpenAI/Azure; default: low for small images, else auto)")
+    if backend is None or isinstance(backend, AnthropicBackend):
+        parser.add_argument("--upload", action="store_true",
+                            help="Upload the image once via the Files API and reuse it on later runs (Anthropic)")
+    args = parser.parse_args(argv)
+
+    prompt = " ".join(args.prompt)  # Join remaining args as prompt
+
+    try:
+        if backend is None:
+            backend = BACKENDS[args.provider]()
+        options = {}
+        if getattr(args, "detail", None) and isinstance(backend, OpenAIBackend):
+            options["detail"] = args.detail
+        if getattr(args, "upload", False) and isinstance(backend, AnthropicBackend):
+            options["upload"] = True
+        result = analyze_image_sync(args.image_path, prompt, backend, crop=args.crop,
+                                    max_dim=args.max_dim, **options)
+        print(result)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
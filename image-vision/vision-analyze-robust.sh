@@ -26,8 +26,8 @@ if [ ! -d "$VENV_DIR" ]; then
     cd "$SKILL_DIR"
     uv venv
     
-    echo "Installing vision SDKs (anthropic, openai, google-genai)..." >&2
-    uv pip install anthropic openai google-genai --quiet
+    echo "Installing vision SDKs (anthropic, openai, google-genai, pillow, pybase64, h2)..." >&2
+    uv pip install anthropic openai google-genai pillow pybase64 h2 --quiet
     
     echo "✓ Setup complete!" >&2
     echo "" >&2
@@ -1,6 +1,6 @@
 #!/bin/bash
 # Auto-setup wrapper for image vision analysis
-# Usage: ./vision-analyze.sh <provider> <image_path> <prompt>
+# Usage: ./vision-analyze.sh <provider> <image_path> <prompt> [--crop X,Y,W,H] [--max-dim N]
 # Example: ./vision-analyze.sh anthropic screenshot.png "Describe this UI"
 
 set -e
@@ -13,7 +13,7 @@ PROMPT="$3"
 
 # Validate arguments
 if [ -z "$IMAGE_PATH" ] || [ -z "$PROMPT" ]; then
-    echo "Usage: vision-analyze.sh <provider> <image_path> <prompt>" >&2
+    echo "Usage: vision-analyze.sh <provider> <image_path> <prompt> [--crop X,Y,W,H] [--max-dim N]" >&2
     echo "Providers: anthropic, openai, gemini, azure" >&2
     echo "" >&2
     echo "Example:" >&2
@@ -27,8 +27,8 @@ if [ ! -d "$VENV_DIR" ]; then
     cd "$SKILL_DIR"
     uv venv
     
-    echo "Installing vision SDKs (anthropic, openai, google-genai)..." >&2
-    uv pip install anthropic openai google-genai --quiet
+    echo "Installing vision SDKs (anthropic, openai, google-genai, pillow, pybase64, h2)..." >&2
+    uv pip install anthropic openai google-genai pillow pybase64 h2 --quiet
     
     echo "✓ Setup complete!" >&2
     echo "" >&2
@@ -72,4 +72,4 @@ case "$PROVIDER" in
 esac
 
 # Run the vision script with venv Python
-exec "$VENV_DIR/bin/python" "$SKILL_DIR/examples/$SCRIPT" "$IMAGE_PATH" "$PROMPT"
+exec "$VENV_DIR/bin/python" "$SKILL_DIR/examples/$SCRIPT" "$IMAGE_PATH" "$PROMPT" "${@:4}"
@@ -30,13 +30,19 @@ Example:
     >>> doc.save("advanced.docx")
 """
 
+import copy
+import io
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Any, Dict
 from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml.ns import qn, nsmap
+from lxml import etree
 
 try:
     from .ooxml import OOXMLDocument
@@ -49,6 +55,66 @@ except ImportError:
     from validation import validate_docx
 
 
+# Lengths are immutable ints, so the same few margin/page/font values can be
+# shared instead of rebuilt on every styling call
+_inches = lru_cache(maxsize=128)(Inches)
+_pt = lru_cache(maxsize=128)(Pt)
+
+
+# Counted inside libxml2 - no element proxies are created for __repr__
+_COUNT_PARAGRAPHS = etree.XPath('count(w:p)', namespaces={'w': nsmap['w']})
+_COUNT_TABLES = etree.XPath('count(w:tbl)', namespaces={'w': nsmap['w']})
+
+
+# Clark-notation tags resolved once instead of through qn()/OxmlElement
+# on every element built or inspected
+_Q_RPR, _Q_B, _Q_T, _Q_PPR, _Q_XML_SPACE = (
+    qn(tag) for tag in ('w:rPr', 'w:b', 'w:t', 'w:pPr', 'xml:space'))
+
+
+@lru_cache(maxsize=1)
+def _default_safe_ops() -> SafeFileOperations:
+    """Shared SafeFileOperations for save(), created on first save.
+    
+    It only holds the default overwrite flag, and save() always passes
+    allow_overwrite explicitly, so every document can use the same one.
+    """
+    return SafeFileOperations(default_allow_overwrite=False)
+
+
+def _run_template(bold: bool = False) -> Any:
+    """Build a ``<w:r>[<w:rPr><w:b/></w:rPr>]<w:t/></w:r>`` template."""
+    run = OxmlElement('w:r')
+    if bold:
+        etree.SubElement(etree.SubElement(run, _Q_RPR), _Q_B)
+    etree.SubElement(run, _Q_T).set(_Q_XML_SPACE, 'preserve')
+    return run
+
+
+# Table-cell runs are deep-copied from these instead of built through
+# CT_R.text, which walks the string a character at a time. The templates
+# themselves are never mutated.
+_RUN_TEMPLATE = _run_template()
+_BOLD_RUN_TEMPLATE = _run_template(bold=True)
+
+
+def _replace_paragraph_text(p: Any, text: str) -> None:
+    """Set a ``w:p``'s text in place, keeping its first run's formatting.
+    
+    Unlike ``paragraph.text = ...``, which drops every run and builds a new
+    unformatted one, the first run (and its ``w:rPr`` from the template) is
+    reused; any other content is removed.
+    """
+    runs = p.r_lst
+    first = runs[0] if runs else None
+    for child in list(p):
+        if child is not first and child.tag != _Q_PPR:
+            p.remove(child)
+    if first is None:
+        first = p.add_r()
+    first.text = text
+
+
 class StyleManager:
     """Manage custom styles.
     
@@ -77,6 +143,53 @@ class StyleManager:
             document: python-docx Document object
         """
         self._document = document
+        self._styles_by_name: Optional[Dict[str, Any]] = None
+        self._styles_count = 0
+    
+    def _index(self) -> Dict[str, Any]:
+        """Return a name -> style dict for O(1) lookups.
+        
+        ``styles[name]`` scans every ``w:style`` element. The dict is rebuilt
+        only when the number of styles changes (e.g. styles added through
+        python-docx directly rather than this manager); _lookup checks each
+        entry it serves.
+        """
+        count = len(self._document.styles.element)
+        if self._styles_by_name is None or count != self._styles_count:
+            self._styles_by_name = {style.name: style for style in self._document.styles}
+            self._styles_count = count
+        return self._styles_by_name
+    
+    def _lookup(self, name: str) -> Any:
+        """Return the style called ``name``, or None if there is none.
+        
+        A hit in the dict is used only while that style still has that name
+        and is still in the document. Anything else - a renamed or removed
+        style, or a name the dict doesn't hold, such as the lowercase
+        built-in ``"heading 1"`` - goes through ``styles[name]``, which
+        resolves names exactly as python-docx does.
+        """
+        index = self._index()
+        style = index.get(name)
+        if (style is not None and style.name == name
+                and style.element.getparent() is self._document.styles.element):
+            return style
+        
+        try:
+            style = self._document.styles[name]
+        except KeyError:
+            return None
+        if style.name == name:
+            index[name] = style
+        return style
+    
+    def _add_style(self, name: str, style_type: Any) -> Any:
+        """Add a style and record it in the lookup dict."""
+        index = self._index()
+        style = self._document.styles.add_style(name, style_type)
+        index[style.name] = style
+        self._styles_count = len(self._document.styles.element)
+        return style
     
     def add_paragraph_style(self, name: str, 
                            font_name: Optional[str] = None,
@@ -108,30 +221,12 @@ class StyleManager:
             ... )
             >>> doc.add_paragraph("Important!", style="Highlight")
         """
-        styles = self._document.styles
-        
-        # Check if style already exists
-        try:
-            existing_style = styles[name]
-            # Style exists, modify it instead of adding
-            style = existing_style
-        except KeyError:
-            # Style doesn't exist, create it
-            style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
-        
-        # Set font properties
-        font = style.font
-        if font_name:
-            font.name = font_name
-        if font_size:
-            font.size = Pt(font_size)
-        if bold:
-            font.bold = True
-        if italic:
-            font.italic = True
-        if color:
-            font.color.rgb = RGBColor(*color)
+        # Modify the style if it already exists, otherwise create it
+        style = self._lookup(name)
+        if style is None:
+            style = self._add_style(name, WD_STYLE_TYPE.PARAGRAPH)
         
+        self._apply_font(style, font_name, font_size, bold, italic, color)
         return style
     
     def add_character_style(self, name: str,
@@ -166,23 +261,35 @@ class StyleManager:
             ...     color=(0, 0, 128)
             ... )
         """
-        styles = self._document.styles
-        style = styles.add_style(name, WD_STYLE_TYPE.CHARACTER)
+        style = self._add_style(name, WD_STYLE_TYPE.CHARACTER)
+        
+        self._apply_font(style, font_name, font_size, bold, italic, color)
+        return style
+    
+    @staticmethod
+    def _apply_font(style: Any, font_name: Optional[str], font_size: Optional[int],
+                    bold: bool, italic: bool, color: Optional[tuple]) -> None:
+        """Write font properties straight into the style's ``w:rPr``.
         
-        # Set font properties
-        font = style.font
+        One pass over a single rPr element, instead of going through the
+        ``style.font`` proxy, which re-resolves rPr for every property.
+        Existing properties the caller doesn't set are left untouched.
+        """
+        rPr = style.element.get_or_add_rPr()
         if font_name:
-            font.name = font_name
-        if font_size:
-            font.size = Pt(font_size)
+            rFonts = rPr.get_or_add_rFonts()
+            rFonts.ascii = font_name
+            rFonts.hAnsi = font_name
         if bold:
-            font.bold = True
+            rPr.get_or_add_b().val = True
         if italic:
-            font.italic = True
+            rPr.get_or_add_i().val = True
         if color:
-            font.color.rgb = RGBColor(*color)
-        
-        return style
+            color_element = rPr.get_or_add_color()
+            color_element.val = RGBColor(*color)
+            color_element.themeColor = None
+        if font_size:
+            rPr.get_or_add_sz().val = _pt(font_size)
     
     def list_styles(self) -> List[str]:
         """List all available styles.
@@ -212,10 +319,7 @@ class StyleManager:
             >>> if heading_style:
             ...     print(f"Font: {heading_style.font.name}")
         """
-        try:
-            return self._document.styles[name]
-        except KeyError:
-            return None
+        return self._lookup(name)
 
 
 class SectionManager:
@@ -246,6 +350,19 @@ class SectionManager:
             document: python-docx Document object
         """
         self._document = document
+        self._current_section = None
+    
+    def _current(self) -> Any:
+        """Return the current (last) section, building it only once.
+        
+        ``document.sections[-1]`` re-scans the body for every ``w:sectPr``
+        on each access. The last section is always the body-level
+        ``w:sectPr`` (add_section moves the previous one into a paragraph),
+        so the cached Section stays valid as sections are added.
+        """
+        if self._current_section is None:
+            self._current_section = self._document.sections[-1]
+        return self._current_section
     
     def add_section(self, 
                    orientation: str = "portrait",
@@ -282,14 +399,15 @@ class SectionManager:
         if orientation.lower() == "landscape":
             # Swap width and height for landscape
             new_section.orientation = 1  # WD_ORIENT.LANDSCAPE
-            new_section.page_width = Inches(page_height or 11)
-            new_section.page_height = Inches(page_width or 8.5)
+            new_section.page_width = _inches(page_height or 11)
+            new_section.page_height = _inches(page_width or 8.5)
         else:
             # Portrait (default)
             new_section.orientation = 0  # WD_ORIENT.PORTRAIT
-            new_section.page_width = Inches(page_width or 8.5)
-            new_section.page_height = Inches(page_height or 11)
+            new_section.page_width = _inches(page_width or 8.5)
+            new_section.page_height = _inches(page_height or 11)
         
+        self._current_section = new_section
         return new_section
     
     def set_margins(self, top: float, bottom: float,
@@ -318,11 +436,11 @@ class SectionManager:
             ...     left=2.0, right=1.0
             ... )
         """
-        section = self._document.sections[-1]
-        section.top_margin = Inches(top)
-        section.bottom_margin = Inches(bottom)
-        section.left_margin = Inches(left)
-        section.right_margin = Inches(right)
+        section = self._current()
+        section.top_margin = _inches(top)
+        section.bottom_margin = _inches(bottom)
+        section.left_margin = _inches(left)
+        section.right_margin = _inches(right)
     
     def add_header(self, text: str) -> None:
         """Add header to current section.
@@ -335,9 +453,7 @@ class SectionManager:
             >>> doc.sections.add_header("Company Confidential")
             >>> doc.add_paragraph("Document content...")
         """
-        section = self._document.sections[-1]
-        header = section.header
-        header.paragraphs[0].text = text
+        _replace_paragraph_text(self._current().header.paragraphs[0]._p, text)
     
     def add_footer(self, text: str) -> None:
         """Add footer to current section.
@@ -350,9 +466,7 @@ class SectionManager:
             >>> doc.sections.add_footer("© 2024 Company Name")
             >>> doc.add_paragraph("Document content...")
         """
-        section = self._document.sections[-1]
-        footer = section.footer
-        footer.paragraphs[0].text = text
+        _replace_paragraph_text(self._current().footer.paragraphs[0]._p, text)
 
 
 class TableBuilder:
@@ -382,6 +496,8 @@ class TableBuilder:
             document: python-docx Document object
         """
         self._document = document
+        self._table_styles: Optional[List[str]] = None
+        self._styles_count = 0
     
     def create_table(self, rows: int, cols: int) -> Any:
         """Create table structure.
@@ -410,7 +526,7 @@ class TableBuilder:
         """Create table from 2D array with optional headers and style.
         
         Args:
-            data: 2D list of cell values
+            data: 2D list of cell values (rows may differ in length)
             headers: Optional header row
             style: Table style name (e.g., "Light Grid Accent 1")
         
@@ -434,8 +550,11 @@ class TableBuilder:
         if not data:
             return None
         
-        # Determine dimensions
-        num_cols = len(data[0])
+        # Determine dimensions: wide enough for the longest row or header,
+        # shorter rows leave their trailing cells empty
+        num_cols = max(len(row) for row in data)
+        if headers:
+            num_cols = max(num_cols, len(headers))
         num_rows = len(data) + (1 if headers else 0)
         
         # Create table
@@ -449,27 +568,34 @@ class TableBuilder:
                 # Style doesn't exist, skip
                 pass
         
-        # Add headers if provided
-        row_offset = 0
+        # Fill cells at the XML level: going through table.rows[i].cells and
+        # cell.text builds proxy objects and re-walks the grid for every cell
+        rows = iter(table._tbl.tr_lst)
         if headers:
-            header_row = table.rows[0]
-            for col_idx, header_text in enumerate(headers):
-                cell = header_row.cells[col_idx]
-                cell.text = header_text
-                # Make header bold
-                for paragraph in cell.paragraphs:
-                    for run in paragraph.runs:
-                        run.bold = True
-            row_offset = 1
-        
-        # Add data rows
-        for row_idx, row_data in enumerate(data):
-            table_row = table.rows[row_idx + row_offset]
-            for col_idx, cell_value in enumerate(row_data):
-                table_row.cells[col_idx].text = str(cell_value)
+            for tc, header_text in zip(next(rows).tc_lst, headers):
+                self._set_cell_text(tc, header_text, bold=True)
+        
+        for tr, row_data in zip(rows, data):
+            for tc, cell_value in zip(tr.tc_lst, row_data):
+                self._set_cell_text(tc, str(cell_value))
         
         return table
     
+    @staticmethod
+    def _set_cell_text(tc: Any, text: str, bold: bool = False) -> None:
+        """Write text into a new table cell's (empty) first paragraph.
+        
+        Header bold comes with the copied template's ``w:rPr``, so there is
+        no per-run formatting pass afterwards.
+        """
+        run = copy.deepcopy(_BOLD_RUN_TEMPLATE if bold else _RUN_TEMPLATE)
+        if '\t' in text or '\n' in text or '\r' in text:
+            # Needs w:tab/w:br elements - CT_R.text lays them out and keeps rPr
+            run.text = text
+        else:
+            run[-1].text = text
+        tc.p_lst[0].append(run)
+    
     def list_table_styles(self) -> List[str]:
         """List available table styles.
         
@@ -482,8 +608,14 @@ class TableBuilder:
             >>> print(f"Found {len(styles)} table styles")
             >>> print(styles[:5])  # Show first 5
         """
-        return [style.name for style in self._document.styles 
-                if style.type == WD_STYLE_TYPE.TABLE]
+        # Wrapping every w:style in a style object is the expensive part, so
+        # keep the names until the number of styles changes
+        count = len(self._document.styles.element)
+        if self._table_styles is None or count != self._styles_count:
+            self._table_styles = [style.name for style in self._document.styles
+                                  if style.type == WD_STYLE_TYPE.TABLE]
+            self._styles_count = count
+        return list(self._table_styles)
 
 
 class ImageManager:
@@ -545,29 +677,17 @@ class ImageManager:
             ...     height_inches=3.0
             ... )
         """
-        image_path = Path(path)
-        if not image_path.exists():
-            raise FileNotFoundError(f"Image not found: {path}")
+        # Only pass the dimensions given; python-docx scales the other
+        size = {key: _inches(value)
+                for key, value in (('width', width_inches), ('height', height_inches))
+                if value}
         
-        # Add image with sizing
-        if width_inches and height_inches:
-            return self._document.add_picture(
-                str(image_path),
-                width=Inches(width_inches),
-                height=Inches(height_inches)
-            )
-        elif width_inches:
-            return self._document.add_picture(
-                str(image_path),
-                width=Inches(width_inches)
-            )
-        elif height_inches:
-            return self._document.add_picture(
-                str(image_path),
-                height=Inches(height_inches)
-            )
-        else:
-            return self._document.add_picture(str(image_path))
+        # Open once and hand python-docx the stream - no separate exists() stat
+        try:
+            with open(path, 'rb') as image_file:
+                return self._document.add_picture(image_file, **size)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Image not found: {path}")
 
 
 class AdvancedDocument:
@@ -579,6 +699,9 @@ class AdvancedDocument:
     Use this API when you need fine-grained control beyond the Simple API.
     For basic document creation, use DocumentBuilder instead.
     
+    Instances share no state with each other, so independent documents can
+    be generated in parallel processes with build_many().
+    
     Attributes:
         styles: StyleManager for custom styles
         sections: SectionManager for page layout
@@ -629,13 +752,15 @@ class AdvancedDocument:
         else:
             self._ooxml_doc = OOXMLDocument.load(template)
         
-        # Initialize managers
-        self._styles = StyleManager(self._ooxml_doc.document)
-        self._sections = SectionManager(self._ooxml_doc.document)
-        self._tables = TableBuilder(self._ooxml_doc.document)
-        self._images = ImageManager(self._ooxml_doc.document)
+        # Only documents built on an external file can carry malformed OOXML;
+        # the bundled templates plus python-docx output don't need checking
+        self._needs_validation = template not in (None, "modern", "legacy")
         
-        self._safe_ops = SafeFileOperations(default_allow_overwrite=False)
+        # Managers are created on first access - most documents only use one or two
+        self._styles: Optional[StyleManager] = None
+        self._sections: Optional[SectionManager] = None
+        self._tables: Optional[TableBuilder] = None
+        self._images: Optional[ImageManager] = None
     
     @property
     def styles(self) -> StyleManager:
@@ -648,6 +773,8 @@ class AdvancedDocument:
             >>> doc = AdvancedDocument()
             >>> doc.styles.add_paragraph_style("Custom", font_size=16)
         """
+        if self._styles is None:
+            self._styles = StyleManager(self._ooxml_doc.document)
         return self._styles
     
     @property
@@ -661,6 +788,8 @@ class AdvancedDocument:
             >>> doc = AdvancedDocument()
             >>> doc.sections.set_margins(1.0, 1.0, 1.0, 1.0)
         """
+        if self._sections is None:
+            self._sections = SectionManager(self._ooxml_doc.document)
         return self._sections
     
     @property
@@ -674,6 +803,8 @@ class AdvancedDocument:
             >>> doc = AdvancedDocument()
             >>> table = doc.tables.create_table(rows=3, cols=4)
         """
+        if self._tables is None:
+            self._tables = TableBuilder(self._ooxml_doc.document)
         return self._tables
     
     @property
@@ -687,6 +818,8 @@ class AdvancedDocument:
             >>> doc = AdvancedDocument()
             >>> doc.images.add_image("photo.jpg", width_inches=5.0)
         """
+        if self._images is None:
+            self._images = ImageManager(self._ooxml_doc.document)
         return self._images
     
     def add_paragraph(self, text: str, style: Optional[str] = None) -> Any:
@@ -738,12 +871,15 @@ class AdvancedDocument:
         """
         return self._ooxml_doc.add_page_break()
     
-    def save(self, output_path: str, overwrite: bool = False) -> str:
+    def save(self, output_path: str, overwrite: bool = False,
+             validate: Optional[bool] = None) -> str:
         """Save with validation.
         
         Args:
             output_path: Where to save document
             overwrite: If False, raises error if file exists
+            validate: Validate the document before writing it. None (default)
+                validates only documents loaded from a template file
         
         Returns:
             Path where document was saved
@@ -756,35 +892,67 @@ class AdvancedDocument:
             >>> doc.add_heading("Document")
             >>> path = doc.save("output.docx")
         """
-        # Save to temp location first
-        temp_path = Path(output_path).parent / f"~temp_{Path(output_path).name}"
-        self._ooxml_doc.save(temp_path)
+        # Serialize in memory: validate the bytes, then write them once
+        buffer = io.BytesIO()
+        self._ooxml_doc.document.save(buffer)
+        data = buffer.getvalue()
         
-        # Validate the saved document
-        try:
-            validation = validate_docx(str(temp_path))
-            if not validation.is_valid:
-                for issue in validation.issues:
-                    print(f"Warning: {issue.message}")
-        except Exception as e:
-            # Don't fail save on validation errors
-            print(f"Warning: Validation failed: {e}")
-        
-        # Use SafeFileOperations to move to final location
-        try:
-            data = temp_path.read_bytes()
-            self._safe_ops.write_file(
-                data=data,
-                target_path=output_path,
-                allow_overwrite=overwrite,
-                backup=overwrite
-            )
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+        if validate is None:
+            validate = self._needs_validation
+        
+        # Validate the serialized document
+        if validate:
+            try:
+                validation = validate_docx(data)
+                if not validation.is_valid:
+                    for issue in validation.issues:
+                        print(f"Warning: {issue.message}")
+            except Exception as e:
+                # Don't fail save on validation errors
+                print(f"Warning: Validation failed: {e}")
+        
+        _default_safe_ops().write_file(
+            data=data,
+            target_path=output_path,
+            allow_overwrite=overwrite,
+            backup=overwrite
+        )
         
         return str(output_path)
     
+    @classmethod
+    def build_many(cls, specs: List[Dict[str, Any]], output_dir: str,
+                   workers: Optional[int] = None) -> List[str]:
+        """Build and save many independent documents in worker processes.
+        
+        Serialization and ZIP compression run in C inside each worker, so
+        batches (reports, mail merge) scale with the number of cores.
+        
+        Args:
+            specs: One dict per document:
+                - filename: Output file name inside output_dir (required)
+                - template: Template passed to AdvancedDocument()
+                - style: Default paragraph style
+                - paragraphs: List of text strings or (text, style) pairs
+                - tables: List of add_table_from_data() keyword dicts
+                - overwrite: Replace an existing file (default False)
+            output_dir: Directory the documents are written to
+            workers: Number of processes (default: one per CPU)
+        
+        Returns:
+            Paths where documents were saved, in spec order
+            
+        Example:
+            >>> specs = [
+            ...     {"filename": f"letter_{name}.docx",
+            ...      "paragraphs": [f"Dear {name},", "Thank you."]}
+            ...     for name in ("Ada", "Grace")
+            ... ]
+            >>> paths = AdvancedDocument.build_many(specs, "out")
+        """
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_build_one, specs, itertools.repeat(output_dir)))
+    
     def get_ooxml_document(self) -> OOXMLDocument:
         """Get underlying OOXMLDocument for raw OOXML operations.
         
@@ -801,6 +969,25 @@ class AdvancedDocument:
     
     def __repr__(self) -> str:
         """String representation."""
-        para_count = len(self._ooxml_doc.get_paragraphs())
-        table_count = len(self._ooxml_doc.get_tables())
+        body = self._ooxml_doc.get_body_element()
+        para_count = int(_COUNT_PARAGRAPHS(body))
+        table_count = int(_COUNT_TABLES(body))
         return f"AdvancedDocument({para_count} paragraphs, {table_count} tables)"
+
+
+def _build_one(spec: Dict[str, Any], output_dir: str) -> str:
+    """Build and save one build_many() spec (runs in a worker process)."""
+    doc = AdvancedDocument(spec.get("template"))
+    default_style = spec.get("style")
+    
+    for paragraph in spec.get("paragraphs", ()):
+        if isinstance(paragraph, str):
+            doc.add_paragraph(paragraph, default_style)
+        else:
+            doc.add_paragraph(*paragraph)
+    
+    for table in spec.get("tables", ()):
+        doc.tables.add_table_from_data(**table)
+    
+    return doc.save(Path(output_dir) / spec["filename"],
+                    overwrite=spec.get("overwrite", False))
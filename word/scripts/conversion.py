@@ -9,6 +9,7 @@ dependencies - just pip install markitdown.
 
 Public Interface:
     - docx_to_markdown: Convert DOCX to Markdown using markitdown
+    - docx_to_markdown_many: Convert many DOCX files in parallel processes
     - extract_text: Extract plain text from DOCX (no formatting)
     - is_markitdown_available: Check if markitdown is installed
 
@@ -25,11 +26,17 @@ Example:
     >>> print(f"Document has {word_count} words")
 """
 
+import hashlib
+import itertools
 import os
 import shutil
+import stat
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from docx import Document
+from typing import Any, Dict, Iterable, Iterator, Optional
+from xml.parsers import expat
 
 try:
     from .safety import SafeFileOperations
@@ -37,11 +44,75 @@ except ImportError:
     from safety import SafeFileOperations
 
 
+# WordprocessingML names as expat reports them ("<namespace URI> <local name>")
+_W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main '
+_W_BR, _W_GRID_BEFORE, _W_GRID_SPAN, _W_V_MERGE = (
+    _W + tag for tag in ('br', 'gridBefore', 'gridSpan', 'vMerge'))
+_W_BR_TYPE, _W_VAL = _W + 'type', _W + 'val'
+
+# Where each element sits in the python-docx view of the document: body
+# paragraphs and tables, rows, cells and their direct paragraphs, and the
+# runs (directly or inside a hyperlink) of those paragraphs. Anything else -
+# tab stops in w:pPr, text boxes, mc:Fallback copies, w:sdt and w:ins
+# content, nested tables - gets no scope, and neither do its descendants.
+_TEXT_SCOPES = {
+    ('', _W + 'document'): 'document',
+    ('document', _W + 'body'): 'body',
+    ('body', _W + 'p'): 'paragraph',
+    ('body', _W + 'tbl'): 'table',
+    ('table', _W + 'tr'): 'row',
+    ('row', _W + 'trPr'): 'row-properties',
+    ('row', _W + 'tc'): 'cell',
+    ('cell', _W + 'tcPr'): 'cell-properties',
+    ('cell', _W + 'p'): 'cell-paragraph',
+    ('paragraph', _W + 'r'): 'run',
+    ('paragraph', _W + 'hyperlink'): 'hyperlink',
+    ('cell-paragraph', _W + 'r'): 'run',
+    ('cell-paragraph', _W + 'hyperlink'): 'hyperlink',
+    ('hyperlink', _W + 'r'): 'run',
+    ('run', _W + 't'): 'text',
+}
+
+# Run children that stand for a fixed piece of text (w:br is handled apart:
+# only line breaks, not page or column breaks, become text)
+_RUN_CHARACTERS = {
+    _W + 'tab': '\t',
+    _W + 'ptab': '\t',
+    _W + 'cr': '\n',
+    _W + 'noBreakHyphen': '-',
+}
+
+# Files are hashed, document.xml parsed and markdown encoded this many
+# bytes (characters) at a time
+_CHUNK_SIZE = 64 * 1024
+
+
+def _validate_file(docx_path: str | Path) -> Path:
+    """Check that a DOCX path is an existing regular file with one stat() call.
+    
+    Raises:
+        FileNotFoundError: If the path doesn't exist
+        ValueError: If the path is not a regular file
+    """
+    docx_file = Path(docx_path)
+    try:
+        mode = os.stat(docx_file).st_mode
+    except FileNotFoundError:
+        raise FileNotFoundError(f"DOCX file not found: {docx_file}") from None
+    
+    if not stat.S_ISREG(mode):
+        raise ValueError(f"Path is not a file: {docx_file}")
+    
+    return docx_file
+
+
+@lru_cache(maxsize=1)
 def is_markitdown_available() -> bool:
     """Check if markitdown library is installed.
     
     markitdown is a lightweight library that requires no system dependencies.
     It's specifically designed for converting documents to Markdown for LLM consumption.
+    The result is cached for the life of the process.
     
     Returns:
         True if markitdown is available, False otherwise
@@ -59,9 +130,42 @@ def is_markitdown_available() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
+def _get_markitdown() -> Any:
+    """Return the shared MarkItDown converter, created on first use.
+    
+    convert() keeps no per-document state on the instance, so one converter
+    can serve every call (and every thread).
+    """
+    from markitdown import MarkItDown
+    return MarkItDown()
+
+
+def _markdown_cache_file(docx_file: Path, cache_dir: Path) -> Path:
+    """Cache entry for a DOCX, keyed by a hash of its content."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(docx_file, 'rb') as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    key = digest.hexdigest()
+    return cache_dir / key[:2] / f"{key}.md"
+
+
+def _encode_chunks(text: str) -> Iterator[bytes]:
+    """UTF-8 encode text a slice at a time.
+    
+    Writing these chunks never holds a second, encoded copy of a large
+    document in memory alongside the string itself.
+    """
+    for start in range(0, len(text), _CHUNK_SIZE):
+        yield text[start:start + _CHUNK_SIZE].encode('utf-8')
+
+
 def docx_to_markdown(
     docx_path: str | Path,
-    output_path: Optional[str | Path] = None
+    output_path: Optional[str | Path] = None,
+    cache_dir: Optional[str | Path] = None,
+    backup: bool = True
 ) -> str:
     """Convert DOCX to Markdown using markitdown (optimized for LLMs).
     
@@ -72,6 +176,11 @@ def docx_to_markdown(
     Args:
         docx_path: Path to DOCX file to convert
         output_path: Optional path to save markdown file. If None, only returns string.
+        cache_dir: Optional directory for converted results, keyed by a hash
+            of the DOCX content. Unchanged files are converted only once;
+            edited files hash differently and are converted again.
+        backup: Copy an existing output_path to .bak before replacing it.
+            Bulk re-ingestion can pass False to skip the copy.
         
     Returns:
         Markdown content as string
@@ -93,6 +202,9 @@ def docx_to_markdown(
         >>> # Use in LLM workflow
         >>> markdown = docx_to_markdown("contract.docx")
         >>> # Now pass markdown to your LLM for analysis
+        >>> 
+        >>> # Re-runs over the same corpus skip unchanged files
+        >>> markdown = docx_to_markdown("contract.docx", cache_dir=".md-cache")
     """
     # Check if markitdown is available
     if not is_markitdown_available():
@@ -102,31 +214,43 @@ def docx_to_markdown(
             "Or with all features: pip install 'markitdown[all]'"
         )
     
-    from markitdown import MarkItDown
-    
     # Validate input file
-    docx_file = Path(docx_path)
-    if not docx_file.exists():
-        raise FileNotFoundError(f"DOCX file not found: {docx_file}")
-    
-    if not docx_file.is_file():
-        raise ValueError(f"Path is not a file: {docx_file}")
+    docx_file = _validate_file(docx_path)
     
     try:
-        # Convert using markitdown
-        md = MarkItDown()
-        result = md.convert(str(docx_file))
-        markdown_content = result.text_content
+        safe_ops = SafeFileOperations()
+        
+        # Reuse an earlier conversion of identical content
+        markdown_content = None
+        cache_file = None
+        if cache_dir is not None:
+            cache_file = _markdown_cache_file(docx_file, Path(cache_dir))
+            try:
+                markdown_content = cache_file.read_text(encoding='utf-8')
+            except FileNotFoundError:
+                pass
+        
+        if markdown_content is None:
+            # Convert using markitdown
+            result = _get_markitdown().convert(str(docx_file))
+            markdown_content = result.text_content
+            
+            if cache_file is not None:
+                safe_ops.write_file(
+                    _encode_chunks(markdown_content),
+                    cache_file,
+                    allow_overwrite=True,
+                    backup=False
+                )
         
         # Save to file if output_path provided
         if output_path:
             output_file = Path(output_path)
-            safe_ops = SafeFileOperations()
             safe_ops.write_file(
-                markdown_content.encode('utf-8'),
+                _encode_chunks(markdown_content),
                 output_file,
                 allow_overwrite=True,
-                backup=True
+                backup=backup
             )
         
         return markdown_content
@@ -135,15 +259,83 @@ def docx_to_markdown(
         raise ValueError(f"Failed to convert DOCX to Markdown: {e}") from e
 
 
-def extract_text(docx_path: str | Path) -> str:
+def docx_to_markdown_many(
+    docx_paths: Iterable[str | Path],
+    output_dir: str | Path,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[str | Path] = None,
+    backup: bool = True
+) -> Dict[Path, Path]:
+    """Convert many DOCX files to Markdown, one worker process per CPU.
+    
+    Each file is independent, so a corpus converts in roughly 1/N of the
+    serial time on N cores. Output files are named after the input file
+    (report.docx -> report.md), so inputs should have distinct names.
+    
+    Args:
+        docx_paths: DOCX files to convert
+        output_dir: Directory the .md files are written to
+        max_workers: Number of processes (default: one per CPU)
+        cache_dir: Optional conversion cache, see docx_to_markdown()
+        backup: Keep .bak copies of replaced outputs, see docx_to_markdown()
+        
+    Returns:
+        Mapping of each input path to the Markdown file written for it
+        
+    Raises:
+        FileNotFoundError: If any input doesn't exist
+        ImportError: If markitdown not installed
+        ValueError: If any conversion fails
+        
+    Example:
+        >>> from pathlib import Path
+        >>> outputs = docx_to_markdown_many(Path("contracts").glob("*.docx"), "markdown")
+        >>> print(f"Converted {len(outputs)} documents")
+    """
+    if not is_markitdown_available():
+        raise ImportError(
+            "markitdown is not installed.\n"
+            "Install with: pip install markitdown\n"
+            "Or with all features: pip install 'markitdown[all]'"
+        )
+    
+    docx_files = [Path(path) for path in docx_paths]
+    output_dir = Path(output_dir)
+    
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        outputs = executor.map(
+            _convert_one,
+            docx_files,
+            itertools.repeat(output_dir),
+            itertools.repeat(cache_dir),
+            itertools.repeat(backup),
+            chunksize=4
+        )
+        return dict(zip(docx_files, outputs))
+
+
+def _convert_one(docx_file: Path, output_dir: Path,
+                 cache_dir: Optional[str | Path], backup: bool) -> Path:
+    """Convert one file for docx_to_markdown_many() (runs in a worker)."""
+    output_file = output_dir / f"{docx_file.stem}.md"
+    docx_to_markdown(docx_file, output_file, cache_dir=cache_dir, backup=backup)
+    return output_file
+
+
+def extract_text(docx_path: str | Path, fast: bool = False) -> str:
     """Extract plain text from DOCX (no formatting).
     
     Extracts all text content from a DOCX document without any formatting,
     styles, or structure. Useful for text analysis, search, or processing.
-    Includes text from both paragraphs and tables.
+    Includes text from both paragraphs and tables; table cells are read in
+    the same single pass over the XML, without python-docx Table/_Cell objects.
     
     Args:
         docx_path: Path to DOCX file
+        fast: Use docx2txt when it is installed (pip install docx2txt). Its
+            output differs: text is in document order, headers and footers
+            are included, and blank lines separate paragraphs. Without
+            docx2txt the default extractor is used.
         
     Returns:
         Plain text content (paragraphs separated by newlines)
@@ -166,40 +358,116 @@ def extract_text(docx_path: str | Path) -> str:
         >>> # Extract for LLM processing
         >>> text = extract_text("contract.docx")
         >>> # Pass text to LLM for analysis
+        >>> 
+        >>> # Quick text for search indexing (docx2txt if installed)
+        >>> text = extract_text("manual.docx", fast=True)
     """
     # Validate input file
-    docx_file = Path(docx_path)
-    if not docx_file.exists():
-        raise FileNotFoundError(f"DOCX file not found: {docx_file}")
-    
-    if not docx_file.is_file():
-        raise ValueError(f"Path is not a file: {docx_file}")
+    docx_file = _validate_file(docx_path)
     
     try:
-        # Load document and extract text
-        doc = Document(docx_file)
+        if fast:
+            try:
+                import docx2txt
+            except ImportError:
+                pass  # Optional - the built-in extractor needs nothing extra
+            else:
+                return docx2txt.process(str(docx_file))
         
-        # Extract text from all paragraphs
-        paragraphs = [para.text for para in doc.paragraphs]
-        
-        # Extract text from tables
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    paragraphs.append(cell.text)
-        
-        # Join with newlines
-        text = "\n".join(paragraphs)
-        
-        return text
+        return _stream_text(docx_file)
         
     except Exception as e:
         raise ValueError(f"Failed to extract text from DOCX: {e}") from e
 
 
+def _stream_text(docx_file: Path) -> str:
+    """Stream word/document.xml straight out of the ZIP and collect its text.
+    
+    Uses the expat SAX parser, so no tree is built at all - not even lxml
+    elements - and memory stays flat regardless of document size. The text
+    matches the python-docx traversal: body paragraphs first, then the text
+    of each table cell, with a merged cell repeated once per grid column it
+    covers, as Row.cells does.
+    """
+    paragraphs = []
+    cells = []
+    cell_paragraphs = []
+    runs = []
+    scopes = ['']
+    above = {}  # grid column -> cell text of the previous row
+    row = {}
+    column = span = 0
+    merge = None
+    
+    def start(name, attrs):
+        nonlocal above, row, column, span, merge
+        parent = scopes[-1]
+        scope = _TEXT_SCOPES.get((parent, name))
+        scopes.append(scope)
+        if parent == 'run':
+            if name in _RUN_CHARACTERS:
+                runs.append(_RUN_CHARACTERS[name])
+            elif name == _W_BR:
+                if attrs.get(_W_BR_TYPE, 'textWrapping') == 'textWrapping':
+                    runs.append('\n')
+        elif scope == 'table':
+            row = {}
+        elif scope == 'row':
+            above, row, column = row, {}, 0
+        elif scope == 'cell':
+            span, merge = 1, None
+        elif parent == 'row-properties' and name == _W_GRID_BEFORE:
+            column = int(attrs.get(_W_VAL, 0))
+        elif parent == 'cell-properties':
+            if name == _W_GRID_SPAN:
+                span = int(attrs.get(_W_VAL, 1))
+            elif name == _W_V_MERGE:
+                merge = attrs.get(_W_VAL, 'continue')
+    
+    def end(name):
+        nonlocal column
+        scope = scopes.pop()
+        if scope == 'paragraph':
+            paragraphs.append(''.join(runs))
+            runs.clear()
+        elif scope == 'cell-paragraph':
+            cell_paragraphs.append(''.join(runs))
+            runs.clear()
+        elif scope == 'cell':
+            # A vertically merged continuation shows the cell above it
+            if merge == 'continue':
+                text = above.get(column, '')
+            else:
+                text = '\n'.join(cell_paragraphs)
+            cell_paragraphs.clear()
+            cells.extend([text] * span)
+            row[column] = text
+            column += span
+    
+    def characters(data):
+        if scopes[-1] == 'text':
+            runs.append(data)
+    
+    parser = expat.ParserCreate(namespace_separator=' ')
+    parser.buffer_text = True
+    parser.buffer_size = _CHUNK_SIZE
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = characters
+    
+    with zipfile.ZipFile(docx_file) as archive, \
+            archive.open('word/document.xml') as stream:
+        while chunk := stream.read(_CHUNK_SIZE):
+            parser.Parse(chunk, False)
+        parser.Parse(b'', True)
+    
+    return '\n'.join(paragraphs + cells)
+
+
 # Public exports
 __all__ = [
     'docx_to_markdown',
+    'docx_to_markdown_many',
     'extract_text',
     'is_markitdown_available',
 ]
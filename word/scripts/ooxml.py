@@ -33,12 +33,18 @@ Example:
     >>> body = doc.get_body_element()
 """
 
+import io
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Any, List, Dict
+from typing import Optional, Any, Iterator, List, Dict
 from docx import Document
+from docx.table import Table
+from docx.text.paragraph import Paragraph
 from docx.oxml.ns import qn
-from docx.oxml import parse_xml
+from docx.oxml.parser import oxml_parser
 from docx.oxml.xmlchemy import BaseOxmlElement
+from lxml import etree
 import xml.etree.ElementTree as ET
 import os
 
@@ -47,6 +53,15 @@ import os
 _MODERN_TEMPLATE_PATH = Path(__file__).parent / "templates" / "modern.docx"
 
 
+@lru_cache(maxsize=1)
+def _modern_template_bytes() -> Optional[bytes]:
+    """Modern template contents, read from disk once per process (None if missing)."""
+    try:
+        return _MODERN_TEMPLATE_PATH.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
 # Common OOXML namespaces
 NAMESPACES = {
     'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main',
@@ -61,6 +76,59 @@ NAMESPACES = {
 }
 
 
+# Body-level block tags, for iterating children without an XPath
+_Q_P = qn('w:p')
+_Q_TBL = qn('w:tbl')
+
+# Counts body paragraphs inside libxml2, without Paragraph wrappers
+_COUNT_PARAGRAPHS = etree.XPath('count(w:p)', namespaces=NAMESPACES)
+
+# Body paragraphs, and the run content python-docx turns into paragraph text
+# (str() of each element gives its text: w:tab -> "\t", w:br -> "\n", ...)
+_BODY_PARAGRAPHS = etree.XPath('w:p', namespaces=NAMESPACES)
+_RUN_CONTENT = etree.XPath(
+    '(w:r | w:hyperlink/w:r)/*[self::w:t or self::w:tab or self::w:br or self::w:cr'
+    ' or self::w:noBreakHyphen or self::w:ptab]',
+    namespaces=NAMESPACES
+)
+
+
+@lru_cache(maxsize=256)
+def _qualified_tag(namespace: Optional[str], tag: str) -> str:
+    """``{uri}tag`` for a NAMESPACES prefix (or the bare tag), built once per tag."""
+    return qn(f'{namespace}:{tag}') if namespace else tag
+
+
+@lru_cache(maxsize=256)
+def _descendant_path(namespace: Optional[str], tag: str) -> str:
+    """``.//{uri}tag`` search path for find_elements(), built once per tag."""
+    return f'.//{_qualified_tag(namespace, tag)}'
+
+
+# A "prefix:name" in a path. Axes ("descendant::") never match because a
+# name must follow the single colon
+_PREFIXED_NAME = re.compile(r'(?<![\w.-])([A-Za-z]\w*):([A-Za-z_][\w.-]*)')
+
+
+@lru_cache(maxsize=256)
+def _compiled_path(path: str) -> etree.ETXPath:
+    """Compile a prefixed path (e.g. './/w:p') once and reuse it.
+    
+    Prefixes from NAMESPACES are rewritten to ``{uri}`` form in one regex
+    pass so the path compiles as an ETXPath; the string work and
+    compilation only happen the first time each path is seen.
+    """
+    return etree.ETXPath(_PREFIXED_NAME.sub(_expand_prefix, path))
+
+
+def _expand_prefix(match: re.Match) -> str:
+    """Rewrite one ``prefix:name`` to ``{uri}name`` if the prefix is known."""
+    prefix, name = match.groups()
+    if prefix in NAMESPACES:
+        return f'{{{NAMESPACES[prefix]}}}{name}'
+    return match.group(0)
+
+
 class OOXMLDocument:
     """Wrapper around python-docx Document with OOXML access.
     
@@ -111,13 +179,19 @@ class OOXMLDocument:
         """
         if document is not None:
             self.document = document
-        elif use_modern_template and _MODERN_TEMPLATE_PATH.exists():
-            # Use modern Microsoft 365 template with Aptos font
-            self.document = Document(str(_MODERN_TEMPLATE_PATH))
+        elif use_modern_template and _modern_template_bytes() is not None:
+            # Use modern Microsoft 365 template with Aptos font, parsed from
+            # the in-memory copy instead of reopening the file every time
+            self.document = Document(io.BytesIO(_modern_template_bytes()))
         else:
             # Fall back to python-docx default template (Calibri font)
             self.document = Document()
         
+        # python-docx resolves .body with a child search on every access;
+        # neither element is ever replaced, so look them up once
+        self._root = self.document._element
+        self._body = self._root.body
+        
         self.path: Optional[Path] = None
     
     @classmethod
@@ -243,6 +317,26 @@ class OOXMLDocument:
         """
         return self.document.paragraphs
     
+    def iter_paragraphs(self) -> Iterator[Any]:
+        """Iterate over paragraphs in document, wrapping each one on demand.
+        
+        Unlike get_paragraphs(), no list of wrappers is built up front, so
+        a scan that stops early only pays for the paragraphs it visited.
+        
+        Yields:
+            python-docx Paragraph objects
+            
+        Example:
+            >>> doc = OOXMLDocument.load("document.docx")
+            >>> first_heading = next(
+            ...     (p for p in doc.iter_paragraphs() if p.style.name.startswith("Heading")),
+            ...     None
+            ... )
+        """
+        parent = self.document._body
+        for p in self._body.iterchildren(_Q_P):
+            yield Paragraph(p, parent)
+    
     def get_tables(self) -> List[Any]:
         """Get all tables in document.
         
@@ -256,6 +350,20 @@ class OOXMLDocument:
         """
         return self.document.tables
     
+    def iter_tables(self) -> Iterator[Any]:
+        """Iterate over tables in document, wrapping each one on demand.
+        
+        Yields:
+            python-docx Table objects
+            
+        Example:
+            >>> doc = OOXMLDocument.load("document.docx")
+            >>> first_table = next(doc.iter_tables(), None)
+        """
+        parent = self.document._body
+        for tbl in self._body.iterchildren(_Q_TBL):
+            yield Table(tbl, parent)
+    
     def get_sections(self) -> List[Any]:
         """Get all sections in document.
         
@@ -282,7 +390,7 @@ class OOXMLDocument:
             >>> body = doc.get_body_element()
             >>> # Direct XML manipulation on body element
         """
-        return self.document._element.body
+        return self._body
     
     def get_document_element(self) -> BaseOxmlElement:
         """Get root document XML element.
@@ -294,7 +402,7 @@ class OOXMLDocument:
             >>> doc = OOXMLDocument()
             >>> root = doc.get_document_element()
         """
-        return self.document._element
+        return self._root
     
     def find_elements(self, tag: str, namespace: Optional[str] = 'w') -> List[BaseOxmlElement]:
         """Find all elements matching tag in document.
@@ -315,15 +423,52 @@ class OOXMLDocument:
             >>> # Find all runs
             >>> runs = doc.find_elements('r')
         """
-        if namespace:
-            # qn() returns the qualified name with full namespace URI
-            qualified_tag = qn(f'{namespace}:{tag}')
-        else:
-            qualified_tag = tag
+        return self._body.findall(_descendant_path(namespace, tag))
+    
+    def iter_elements(self, tag: str, namespace: Optional[str] = 'w') -> Iterator[BaseOxmlElement]:
+        """Iterate lazily over elements matching tag in document.
         
-        # Use findall with qualified name
-        body = self.get_body_element()
-        return body.findall(f'.//{qualified_tag}')
+        Like find_elements(), but matches are produced as the tree is walked,
+        so taking the first few (or stopping early) never builds the full list.
+        
+        Args:
+            tag: Tag name (without namespace prefix)
+            namespace: Namespace key from NAMESPACES dict (default: 'w')
+            
+        Yields:
+            Matching XML elements in document order
+            
+        Example:
+            >>> doc = OOXMLDocument.load("document.docx")
+            >>> first_table = next(doc.iter_elements('tbl'), None)
+        """
+        return self._body.iterfind(_descendant_path(namespace, tag))
+    
+    def index_elements(self, *tags: str,
+                       namespace: Optional[str] = 'w') -> Dict[str, List[BaseOxmlElement]]:
+        """Find elements for several tags in a single walk over the body.
+        
+        Equivalent to calling find_elements() once per tag, but the tree is
+        traversed only once. The result is a snapshot: it does not follow
+        later changes to the document.
+        
+        Args:
+            *tags: Tag names (without namespace prefix)
+            namespace: Namespace key from NAMESPACES dict (default: 'w')
+            
+        Returns:
+            Dict mapping each tag to its matching elements in document order
+            
+        Example:
+            >>> doc = OOXMLDocument.load("document.docx")
+            >>> index = doc.index_elements('p', 'r', 'tbl')
+            >>> print(f"{len(index['r'])} runs in {len(index['p'])} paragraphs")
+        """
+        qualified = {_qualified_tag(namespace, tag): tag for tag in tags}
+        index = {tag: [] for tag in tags}
+        for element in self._body.iterdescendants(*qualified):
+            index[qualified[element.tag]].append(element)
+        return index
     
     def get_core_properties(self) -> Any:
         """Get document core properties (metadata).
@@ -379,8 +524,10 @@ class OOXMLDocument:
             >>> doc.add_custom_xml(xml)
             >>> doc.save("custom.docx")
         """
-        element = parse_xml(xml_string)
-        self.get_body_element().append(element)
+        # python-docx's own module-level parser: created once, and it maps
+        # tags to the custom element classes (CT_P, CT_R, ...)
+        element = etree.fromstring(xml_string, oxml_parser)
+        self._body.append(element)
         return element
     
     # Utility methods
@@ -396,7 +543,9 @@ class OOXMLDocument:
             >>> text = doc.get_text()
             >>> print(f"Document has {len(text)} characters")
         """
-        return '\n'.join(para.text for para in self.document.paragraphs)
+        # Same text as joining Paragraph.text, but each paragraph's content is
+        # selected by one compiled XPath instead of python-docx wrappers per run
+        return '\n'.join(''.join(map(str, _RUN_CONTENT(p))) for p in _BODY_PARAGRAPHS(self._body))
     
     def get_word_count(self) -> int:
         """Get approximate word count.
@@ -409,14 +558,17 @@ class OOXMLDocument:
             >>> words = doc.get_word_count()
             >>> print(f"Document has {words:,} words")
         """
-        text = self.get_text()
-        return len(text.split())
+        # Counted a paragraph at a time: words never span paragraphs, and
+        # neither the joined document text nor a list of every word is built
+        return sum(len(''.join(map(str, _RUN_CONTENT(p))).split())
+                   for p in _BODY_PARAGRAPHS(self._body))
     
     def clear_content(self) -> None:
         """Remove all content from document body.
         
         Warning:
             This removes ALL paragraphs, tables, and other elements.
+            Only the document's final section properties are kept.
             Use with caution.
             
         Example:
@@ -425,14 +577,18 @@ class OOXMLDocument:
             >>> doc.add_paragraph("Fresh start")
             >>> doc.save()
         """
-        body = self.get_body_element()
-        for element in list(body):
-            body.remove(element)
+        body = self._body
+        # One bulk removal instead of a remove() per child; the final
+        # section properties (page size, margins, orientation) are kept
+        sectPr = body.sectPr
+        del body[:]
+        if sectPr is not None:
+            body.append(sectPr)
     
     def __repr__(self) -> str:
         """String representation of document."""
         path_str = f"'{self.path}'" if self.path else "unsaved"
-        para_count = len(self.get_paragraphs())
+        para_count = int(_COUNT_PARAGRAPHS(self._body))
         word_count = self.get_word_count()
         return f"OOXMLDocument({path_str}, {para_count} paragraphs, {word_count} words)"
 
@@ -473,19 +629,7 @@ def get_xml_element(element: BaseOxmlElement, path: str, namespaces: Optional[Di
         >>> # Convert namespace prefix to qualified name
         >>> first_para = get_xml_element(body, './/w:p', NAMESPACES)
     """
-    # Convert XPath with namespace prefixes to qualified names
-    # For simple paths like './/w:p', extract namespace prefix and tag
-    if '/' in path:
-        parts = path.split('/')
-        for i, part in enumerate(parts):
-            if ':' in part and part != '.':
-                prefix, tag = part.split(':', 1)
-                if prefix in NAMESPACES:
-                    # Replace with qualified name
-                    parts[i] = qn(f'{prefix}:{tag}')
-        path = '/'.join(parts)
-    
-    results = element.findall(path)
+    results = _compiled_path(path)(element)
     return results[0] if results else None
 
 
@@ -506,18 +650,7 @@ def get_xml_elements(element: BaseOxmlElement, path: str, namespaces: Optional[D
         >>> all_paras = get_xml_elements(body, './/w:p', NAMESPACES)
         >>> print(f"Found {len(all_paras)} paragraphs")
     """
-    # Convert XPath with namespace prefixes to qualified names
-    if '/' in path:
-        parts = path.split('/')
-        for i, part in enumerate(parts):
-            if ':' in part and part != '.':
-                prefix, tag = part.split(':', 1)
-                if prefix in NAMESPACES:
-                    # Replace with qualified name
-                    parts[i] = qn(f'{prefix}:{tag}')
-        path = '/'.join(parts)
-    
-    return element.findall(path)
+    return _compiled_path(path)(element)
 
 
 def set_xml_property(element: BaseOxmlElement, property_path: str, value: str, namespaces: Optional[Dict[str, str]] = None) -> bool:
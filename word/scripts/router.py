@@ -7,9 +7,11 @@ with reasoning and example code.
 
 Public Interface:
     - recommend_api: Get API recommendation from task description
+    - recommend_api_batch: Get recommendations for many task descriptions
     - should_use_simple_api: Check if Simple API is sufficient
     - should_use_advanced_api: Check if Advanced API is needed
     - should_use_ooxml_api: Check if Raw OOXML is required
+    - Requirement: Bit flags for the requirements found in a description
     - Recommendation: Dataclass with recommendation details
 
 Example:
@@ -29,11 +31,98 @@ Example:
 """
 
 from dataclasses import dataclass
-from typing import Literal, List, Dict, Any
+from enum import IntFlag
+from functools import lru_cache
+from typing import Literal, Tuple, List, Dict, Any, Iterable, Mapping, Union
 import re
 
 
-@dataclass
+# Distinct task descriptions whose Recommendation is memoized. Agent sessions
+# ask about the same short descriptions over and over (retries, repeated
+# tool calls); Recommendations are frozen, so sharing them is safe.
+_RECOMMEND_CACHE_SIZE = 1024
+
+class Requirement(IntFlag):
+    """Requirements detected in a task description, one bit each.
+    
+    A combined mask also reads like the requirements dict it replaces, so
+    ``req["tables"]`` and ``req.get("tables")`` keep working.
+    """
+    # Simple features
+    HEADINGS = 1 << 0
+    PARAGRAPHS = 1 << 1
+    LISTS = 1 << 2
+    TABLES = 1 << 3
+    IMAGES = 1 << 4
+    # Advanced features
+    CUSTOM_STYLES = 1 << 5
+    CUSTOM_PAGE_LAYOUT = 1 << 6
+    HEADERS_FOOTERS = 1 << 7
+    ADVANCED_TABLES = 1 << 8
+    # OOXML features
+    XML_MANIPULATION = 1 << 9
+    COMPLEX_SECTIONS = 1 << 10
+    
+    def __getitem__(self, name: str) -> bool:
+        return bool(self & Requirement[name.upper()])
+    
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return whether requirement ``name`` is set, or ``default`` if unknown."""
+        flag = Requirement.__members__.get(name.upper())
+        return default if flag is None else bool(self & flag)
+
+
+# Features the Advanced API adds over the Simple API
+_ADVANCED_MASK = (
+    Requirement.CUSTOM_STYLES
+    | Requirement.CUSTOM_PAGE_LAYOUT
+    | Requirement.HEADERS_FOOTERS
+    | Requirement.ADVANCED_TABLES
+    | Requirement.COMPLEX_SECTIONS
+)
+
+# Features the Simple API cannot handle
+_COMPLEX_MASK = _ADVANCED_MASK | Requirement.XML_MANIPULATION
+
+# Keywords that signal each requirement, matched as substrings of the
+# lowercase task description
+_REQUIREMENT_KEYWORDS = {
+    Requirement.HEADINGS: ("heading", "title", "chapter"),
+    Requirement.PARAGRAPHS: ("paragraph", "text", "content", "body"),
+    Requirement.LISTS: ("list", "bullet", "numbered", "items"),
+    Requirement.TABLES: ("table",),
+    Requirement.IMAGES: ("image", "picture", "photo", "graphic"),
+    Requirement.CUSTOM_STYLES: ("custom style", "create style", "define style",
+                                "paragraph style", "character style"),
+    Requirement.CUSTOM_PAGE_LAYOUT: ("margin", "orientation", "landscape", "portrait", "page size"),
+    Requirement.HEADERS_FOOTERS: ("header", "footer"),
+    Requirement.ADVANCED_TABLES: ("table style", "merge cell", "table format"),
+    Requirement.XML_MANIPULATION: ("xml", "ooxml", "low-level", "direct manipulation", "custom element"),
+    Requirement.COMPLEX_SECTIONS: ("section", "different layout", "multi-section"),
+}
+
+# Mask of every requirement a keyword implies, including those of shorter
+# keywords inside it ("table style" also means "table"), so one match
+# reports them all
+_KEYWORD_REQUIREMENTS = {
+    keyword: sum(flag for flag, words in _REQUIREMENT_KEYWORDS.items()
+                 if any(word in keyword for word in words))
+    for words in _REQUIREMENT_KEYWORDS.values()
+    for keyword in words
+}
+
+# All keywords in one automaton. The zero-width lookahead is tried at every
+# position, longest keyword first, so overlapping occurrences ("listable"
+# holds "list" and "table") are all reported in a single scan
+_KEYWORD_RE = re.compile("(?=(%s))" % "|".join(
+    re.escape(keyword) for keyword in sorted(_KEYWORD_REQUIREMENTS, key=len, reverse=True)
+))
+
+# Descriptions shorter than every keyword cannot match any of them
+_MIN_KEYWORD_LENGTH = min(map(len, _KEYWORD_REQUIREMENTS))
+
+
+@dataclass(frozen=True, slots=True)
 class Recommendation:
     """API recommendation with reasoning.
     
@@ -41,7 +130,7 @@ class Recommendation:
         api_level: Recommended API level ("simple", "advanced", or "ooxml")
         reasoning: Explanation of why this API was recommended
         example_code: Python code example using recommended API
-        alternatives: List of alternative approaches or considerations
+        alternatives: Alternative approaches or considerations
     
     Example:
         >>> rec = recommend_api("Create document with table")
@@ -52,14 +141,16 @@ class Recommendation:
     api_level: Literal["simple", "advanced", "ooxml"]
     reasoning: str
     example_code: str
-    alternatives: List[str]
+    alternatives: Tuple[str, ...]
 
 
+@lru_cache(maxsize=_RECOMMEND_CACHE_SIZE)
 def recommend_api(task_description: str) -> Recommendation:
     """Recommend API level for task.
     
     Analyzes the task description using keyword matching and heuristics to
-    determine which API level is most appropriate.
+    determine which API level is most appropriate. Results are memoized per
+    description, so repeated calls return the same Recommendation object.
     
     Args:
         task_description: Natural language description of what user wants to do
@@ -80,21 +171,61 @@ def recommend_api(task_description: str) -> Recommendation:
         >>> rec = recommend_api("Modify XML structure of document body")
         >>> assert rec.api_level == "ooxml"
     """
+    if len(task_description) < _MIN_KEYWORD_LENGTH:
+        return _SIMPLE_RECOMMENDATION
+    
     task_lower = task_description.lower()
     
+    # Any mention of XML decides the outcome, and the OOXML recommendation
+    # does not depend on the other requirements
+    if "xml" in task_lower:
+        return _OOXML_RECOMMENDATION
+    
     # Extract requirements from description
     requirements = _extract_requirements(task_lower)
     
-    # Decision tree
-    if should_use_ooxml_api(requirements):
+    # Decision tree, most common outcome first: most tasks need nothing
+    # beyond the Simple API, and XML manipulation overrides advanced features
+    if not requirements & _COMPLEX_MASK:
+        return _simple_recommendation(task_description, requirements)
+    elif requirements & Requirement.XML_MANIPULATION:
         return _ooxml_recommendation(task_description, requirements)
-    elif should_use_advanced_api(requirements):
-        return _advanced_recommendation(task_description, requirements)
     else:
-        return _simple_recommendation(task_description, requirements)
+        return _advanced_recommendation(task_description, requirements)
+
+
+def recommend_api_batch(task_descriptions: Iterable[str]) -> List[Recommendation]:
+    """Recommend API levels for many task descriptions.
+    
+    Each distinct description is classified once; duplicates and
+    descriptions with the same outcome share one Recommendation.
+    
+    Args:
+        task_descriptions: Natural language task descriptions
+    
+    Returns:
+        One Recommendation per description, in input order
+    
+    Example:
+        >>> recs = recommend_api_batch(["Add a table", "Edit the XML"])
+        >>> [rec.api_level for rec in recs]
+        ['simple', 'ooxml']
+    """
+    # Bypass recommend_api's lru_cache: a large batch of one-off descriptions
+    # would only evict the entries interactive callers rely on
+    classify = recommend_api.__wrapped__
+    seen: Dict[str, Recommendation] = {}
+    
+    recommendations = []
+    for task in task_descriptions:
+        rec = seen.get(task)
+        if rec is None:
+            rec = seen[task] = classify(task)
+        recommendations.append(rec)
+    return recommendations
 
 
-def should_use_simple_api(requirements: Dict[str, Any]) -> bool:
+def should_use_simple_api(requirements: Union[Requirement, Mapping[str, Any]]) -> bool:
     """Check if Simple API is sufficient.
     
     Simple API is suitable for:
@@ -105,7 +236,7 @@ def should_use_simple_api(requirements: Dict[str, Any]) -> bool:
     - No custom styles or complex page layout
     
     Args:
-        requirements: Dictionary of extracted requirements
+        requirements: Requirement mask, or dictionary of requirement flags
     
     Returns:
         True if Simple API is sufficient
@@ -120,20 +251,11 @@ def should_use_simple_api(requirements: Dict[str, Any]) -> bool:
         ... }
         >>> assert should_use_simple_api(requirements) == True
     """
-    # Simple API NOT sufficient if any of these are true
-    complex_features = [
-        requirements.get("custom_styles"),
-        requirements.get("custom_page_layout"),
-        requirements.get("headers_footers"),
-        requirements.get("advanced_tables"),
-        requirements.get("xml_manipulation"),
-        requirements.get("complex_sections"),
-    ]
-    
-    return not any(complex_features)
+    # Simple API NOT sufficient if any complex feature is requested
+    return not _as_mask(requirements) & _COMPLEX_MASK
 
 
-def should_use_advanced_api(requirements: Dict[str, Any]) -> bool:
+def should_use_advanced_api(requirements: Union[Requirement, Mapping[str, Any]]) -> bool:
     """Check if Advanced API is needed.
     
     Advanced API is needed for:
@@ -144,7 +266,7 @@ def should_use_advanced_api(requirements: Dict[str, Any]) -> bool:
     - Multiple sections with different layouts
     
     Args:
-        requirements: Dictionary of extracted requirements
+        requirements: Requirement mask, or dictionary of requirement flags
     
     Returns:
         True if Advanced API is needed
@@ -157,22 +279,13 @@ def should_use_advanced_api(requirements: Dict[str, Any]) -> bool:
         ... }
         >>> assert should_use_advanced_api(requirements) == True
     """
-    advanced_features = [
-        requirements.get("custom_styles"),
-        requirements.get("custom_page_layout"),
-        requirements.get("headers_footers"),
-        requirements.get("advanced_tables"),
-        requirements.get("complex_sections"),
-    ]
+    mask = _as_mask(requirements)
     
     # Need Advanced if any advanced features present but no XML manipulation
-    has_advanced = any(advanced_features)
-    needs_xml = requirements.get("xml_manipulation", False)
-    
-    return has_advanced and not needs_xml
+    return bool(mask & _ADVANCED_MASK) and not mask & Requirement.XML_MANIPULATION
 
 
-def should_use_ooxml_api(requirements: Dict[str, Any]) -> bool:
+def should_use_ooxml_api(requirements: Union[Requirement, Mapping[str, Any]]) -> bool:
     """Check if Raw OOXML is required.
     
     OOXML API is required for:
@@ -182,7 +295,7 @@ def should_use_ooxml_api(requirements: Dict[str, Any]) -> bool:
     - Features not exposed by higher-level APIs
     
     Args:
-        requirements: Dictionary of extracted requirements
+        requirements: Requirement mask, or dictionary of requirement flags
     
     Returns:
         True if OOXML API is required
@@ -193,82 +306,47 @@ def should_use_ooxml_api(requirements: Dict[str, Any]) -> bool:
         ... }
         >>> assert should_use_ooxml_api(requirements) == True
     """
-    return requirements.get("xml_manipulation", False)
+    return bool(_as_mask(requirements) & Requirement.XML_MANIPULATION)
 
 
-def _extract_requirements(task_description: str) -> Dict[str, Any]:
+def _as_mask(requirements: Union[Requirement, Mapping[str, Any]]) -> Requirement:
+    """Convert a requirements dict to a mask; masks pass through unchanged."""
+    if isinstance(requirements, int):
+        return requirements
+    
+    mask = Requirement(0)
+    for flag in Requirement:
+        if requirements.get(flag.name.lower()):
+            mask |= flag
+    return mask
+
+
+def _extract_requirements(task_description: str) -> Requirement:
     """Extract requirements from task description using keyword matching.
     
     Args:
         task_description: Lowercase task description
     
     Returns:
-        Dictionary of boolean requirements
+        Mask of the requirements found
     """
-    requirements = {
-        "headings": False,
-        "paragraphs": False,
-        "lists": False,
-        "tables": False,
-        "images": False,
-        "custom_styles": False,
-        "custom_page_layout": False,
-        "headers_footers": False,
-        "advanced_tables": False,
-        "xml_manipulation": False,
-        "complex_sections": False,
-    }
-    
-    # Simple features
-    if any(word in task_description for word in ["heading", "title", "chapter"]):
-        requirements["headings"] = True
-    
-    if any(word in task_description for word in ["paragraph", "text", "content", "body"]):
-        requirements["paragraphs"] = True
-    
-    if any(word in task_description for word in ["list", "bullet", "numbered", "items"]):
-        requirements["lists"] = True
-    
-    if "table" in task_description:
-        requirements["tables"] = True
-    
-    if any(word in task_description for word in ["image", "picture", "photo", "graphic"]):
-        requirements["images"] = True
-    
-    # Advanced features
-    if any(word in task_description for word in ["custom style", "create style", "define style", "paragraph style", "character style"]):
-        requirements["custom_styles"] = True
-    
-    if any(word in task_description for word in ["margin", "orientation", "landscape", "portrait", "page size"]):
-        requirements["custom_page_layout"] = True
+    mask = 0
     
-    if any(word in task_description for word in ["header", "footer"]):
-        requirements["headers_footers"] = True
+    # One pass over the description finds every keyword occurrence
+    for match in _KEYWORD_RE.finditer(task_description):
+        mask |= _KEYWORD_REQUIREMENTS[match.group(1)]
     
-    if any(word in task_description for word in ["table style", "merge cell", "table format"]):
-        requirements["advanced_tables"] = True
-    
-    if any(word in task_description for word in ["section", "different layout", "multi-section"]):
-        requirements["complex_sections"] = True
-    
-    # OOXML features
-    if any(word in task_description for word in ["xml", "ooxml", "low-level", "direct manipulation", "custom element"]):
-        requirements["xml_manipulation"] = True
-    
-    return requirements
+    return Requirement(mask)
 
 
-def _simple_recommendation(task: str, req: Dict[str, Any]) -> Recommendation:
-    """Generate recommendation for Simple API."""
-    
-    reasoning = (
-        "Simple API is recommended because your task involves basic document "
-        "creation with standard elements (headings, paragraphs, lists, tables, images). "
-        "The Simple API provides a fluent interface with method chaining for quick "
-        "document creation."
-    )
-    
-    example_code = '''from docx_skill.simple import DocumentBuilder
+_SIMPLE_REASONING = (
+    "Simple API is recommended because your task involves basic document "
+    "creation with standard elements (headings, paragraphs, lists, tables, images). "
+    "The Simple API provides a fluent interface with method chaining for quick "
+    "document creation."
+)
+
+_SIMPLE_EXAMPLE = '''from docx_skill.simple import DocumentBuilder
 
 # Create document with method chaining
 doc = DocumentBuilder()
@@ -287,46 +365,38 @@ doc.add_table(
 
 # Save document
 doc.save("output.docx")'''
-    
-    alternatives = [
-        "If you need custom styles or page layout, consider Advanced API",
-        "All Simple API methods support method chaining for cleaner code",
-        "Use overwrite=True in save() to allow file overwrites",
-    ]
-    
-    return Recommendation(
-        api_level="simple",
-        reasoning=reasoning,
-        example_code=example_code,
-        alternatives=alternatives
-    )
 
+_SIMPLE_ALTERNATIVES = (
+    "If you need custom styles or page layout, consider Advanced API",
+    "All Simple API methods support method chaining for cleaner code",
+    "Use overwrite=True in save() to allow file overwrites",
+)
 
-def _advanced_recommendation(task: str, req: Dict[str, Any]) -> Recommendation:
-    """Generate recommendation for Advanced API."""
-    
-    features = []
-    if req.get("custom_styles"):
-        features.append("custom styles")
-    if req.get("custom_page_layout"):
-        features.append("page layout control")
-    if req.get("headers_footers"):
-        features.append("headers/footers")
-    if req.get("advanced_tables"):
-        features.append("advanced table styling")
-    if req.get("complex_sections"):
-        features.append("multiple sections")
-    
-    feature_str = ", ".join(features) if features else "advanced formatting"
-    
-    reasoning = (
-        f"Advanced API is recommended because your task requires {feature_str}. "
-        "The Advanced API provides specialized managers (StyleManager, SectionManager, "
-        "TableBuilder, ImageManager) for fine-grained control over document structure "
-        "and formatting."
-    )
-    
-    example_code = '''from docx_skill.advanced import AdvancedDocument
+# Nothing in the Simple and OOXML recommendations depends on the task, so
+# each is built once and shared
+_SIMPLE_RECOMMENDATION = Recommendation(
+    api_level="simple",
+    reasoning=_SIMPLE_REASONING,
+    example_code=_SIMPLE_EXAMPLE,
+    alternatives=_SIMPLE_ALTERNATIVES
+)
+
+
+def _simple_recommendation(task: str, req: Requirement) -> Recommendation:
+    """Generate recommendation for Simple API."""
+    return _SIMPLE_RECOMMENDATION
+
+
+# Advanced requirements as they are named in the reasoning, in order
+_ADVANCED_FEATURES = (
+    (Requirement.CUSTOM_STYLES, "custom styles"),
+    (Requirement.CUSTOM_PAGE_LAYOUT, "page layout control"),
+    (Requirement.HEADERS_FOOTERS, "headers/footers"),
+    (Requirement.ADVANCED_TABLES, "advanced table styling"),
+    (Requirement.COMPLEX_SECTIONS, "multiple sections"),
+)
+
+_ADVANCED_EXAMPLE = '''from docx_skill.advanced import AdvancedDocument
 
 # Create document with advanced features
 doc = AdvancedDocument()
@@ -356,32 +426,58 @@ table = doc.tables.add_table_from_data(
 
 # Save
 doc.save("output.docx")'''
+
+_ADVANCED_ALTERNATIVES = (
+    "If you don't need advanced features, Simple API is easier",
+    "Access underlying OOXMLDocument with get_ooxml_document() for raw XML access",
+    "All managers are accessible via properties: doc.styles, doc.sections, etc.",
+)
+
+
+# Advanced recommendations keyed by their advanced-feature bits; at most 32
+# distinct ones exist, each built on first use and shared afterwards
+_ADVANCED_RECOMMENDATIONS: Dict[int, Recommendation] = {}
+
+
+def _advanced_recommendation(task: str, req: Requirement) -> Recommendation:
+    """Generate recommendation for Advanced API."""
+    features = int(req & _ADVANCED_MASK)
+    rec = _ADVANCED_RECOMMENDATIONS.get(features)
+    if rec is None:
+        rec = _ADVANCED_RECOMMENDATIONS[features] = _build_advanced_recommendation(features)
+    return rec
+
+
+def _build_advanced_recommendation(features: int) -> Recommendation:
+    """Build the Advanced API recommendation for a set of feature bits."""
     
-    alternatives = [
-        "If you don't need advanced features, Simple API is easier",
-        "Access underlying OOXMLDocument with get_ooxml_document() for raw XML access",
-        "All managers are accessible via properties: doc.styles, doc.sections, etc.",
-    ]
+    feature_str = ", ".join(
+        label for flag, label in _ADVANCED_FEATURES if features & flag
+    ) or "advanced formatting"
+    
+    reasoning = (
+        f"Advanced API is recommended because your task requires {feature_str}. "
+        "The Advanced API provides specialized managers (StyleManager, SectionManager, "
+        "TableBuilder, ImageManager) for fine-grained control over document structure "
+        "and formatting."
+    )
     
     return Recommendation(
         api_level="advanced",
         reasoning=reasoning,
-        example_code=example_code,
-        alternatives=alternatives
+        example_code=_ADVANCED_EXAMPLE,
+        alternatives=_ADVANCED_ALTERNATIVES
     )
 
 
-def _ooxml_recommendation(task: str, req: Dict[str, Any]) -> Recommendation:
-    """Generate recommendation for OOXML API."""
-    
-    reasoning = (
-        "OOXML API is recommended because your task requires direct XML manipulation "
-        "or low-level control over document structure. This API provides direct access "
-        "to the underlying Office Open XML format, allowing you to create custom elements "
-        "or modify the document structure in ways not exposed by higher-level APIs."
-    )
-    
-    example_code = '''from docx_skill.ooxml import OOXMLDocument, get_xml_element
+_OOXML_REASONING = (
+    "OOXML API is recommended because your task requires direct XML manipulation "
+    "or low-level control over document structure. This API provides direct access "
+    "to the underlying Office Open XML format, allowing you to create custom elements "
+    "or modify the document structure in ways not exposed by higher-level APIs."
+)
+
+_OOXML_EXAMPLE = '''from docx_skill.ooxml import OOXMLDocument, get_xml_element
 
 # Create document with OOXML access
 doc = OOXMLDocument()
@@ -404,17 +500,22 @@ docx_obj = doc.document
 
 # Save
 doc.save("output.docx")'''
-    
-    alternatives = [
-        "Only use OOXML API if higher-level APIs don't meet your needs",
-        "Consider Simple or Advanced APIs first - they're easier and safer",
-        "Direct XML manipulation requires knowledge of OOXML specification",
-        "Use doc.document to access underlying python-docx Document object",
-    ]
-    
-    return Recommendation(
-        api_level="ooxml",
-        reasoning=reasoning,
-        example_code=example_code,
-        alternatives=alternatives
-    )
+
+_OOXML_ALTERNATIVES = (
+    "Only use OOXML API if higher-level APIs don't meet your needs",
+    "Consider Simple or Advanced APIs first - they're easier and safer",
+    "Direct XML manipulation requires knowledge of OOXML specification",
+    "Use doc.document to access underlying python-docx Document object",
+)
+
+_OOXML_RECOMMENDATION = Recommendation(
+    api_level="ooxml",
+    reasoning=_OOXML_REASONING,
+    example_code=_OOXML_EXAMPLE,
+    alternatives=_OOXML_ALTERNATIVES
+)
+
+
+def _ooxml_recommendation(task: str, req: Requirement) -> Recommendation:
+    """Generate recommendation for OOXML API."""
+    return _OOXML_RECOMMENDATION
@@ -24,14 +24,214 @@ Example:
     >>> safe_ops.write_file(data, "output.docx", allow_overwrite=False)
 """
 
+import errno
+import hashlib
+import itertools
 import os
 import shutil
+import stat
 import tempfile
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Callable, Any
-import uuid
+from typing import Optional, Callable, Any, Iterable, Iterator
+
+
+# Write buffer for write_file: chunked data (e.g. 64 KB pieces from the
+# converters) is coalesced into 1 MB write() calls. Whole bytes objects
+# larger than this bypass the buffer and go to the file in one call
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Bytes requested per os.copy_file_range call; the kernel copies up to EOF,
+# so regular files finish in one call plus the one that reports EOF
+_COPY_RANGE_BLOCK = 1 << 30
+
+# copy_file_range errors meaning "not supported here" (old kernel, seccomp,
+# cross-filesystem on kernels before 5.3, special files) rather than real
+# I/O failures; the copy falls back to shutil.copyfile
+_COPY_RANGE_UNSUPPORTED = frozenset(
+    getattr(errno, name) for name in
+    ('ENOSYS', 'EXDEV', 'EINVAL', 'EOPNOTSUPP', 'ENOTSUP', 'EPERM', 'ETXTBSY')
+    if hasattr(errno, name)
+)
+
+
+def _copy_file(source: Path, target: Path, metadata: bool = True) -> None:
+    """Copy a file's contents without passing them through Python.
+    
+    Uses os.copy_file_range where available, which copies inside the kernel
+    and shares extents (reflinks) on btrfs and XFS. Otherwise falls back to
+    shutil.copyfile, which uses sendfile on Linux.
+    
+    Args:
+        source: File to copy
+        target: Destination, created or truncated
+        metadata: Also copy permission bits and timestamps, like shutil.copy2
+    """
+    if not (hasattr(os, 'copy_file_range') and _copy_file_range(source, target)):
+        shutil.copyfile(source, target)
+    if metadata:
+        shutil.copystat(source, target)
+
+
+def _copy_file_range(source: Path, target: Path) -> bool:
+    """Copy with os.copy_file_range; False if it cannot be used for this file."""
+    # Open the target without truncating it, so copying a file onto itself
+    # (e.g. through a hard link) is caught before it destroys the data
+    with open(source, 'rb') as src, \
+            open(os.open(target, os.O_WRONLY | os.O_CREAT, 0o666), 'wb') as dst:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        src_stat, dst_stat = os.fstat(src_fd), os.fstat(dst_fd)
+        if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+            raise shutil.SameFileError(f"{source!r} and {target!r} are the same file")
+        os.ftruncate(dst_fd, 0)
+        
+        try:
+            copied = os.copy_file_range(src_fd, dst_fd, _COPY_RANGE_BLOCK)
+        except OSError as e:
+            if e.errno in _COPY_RANGE_UNSUPPORTED:
+                return False
+            raise
+        
+        # Nothing copied is ambiguous: an empty file, or a procfs-style file
+        # that reports size 0; let the fallback read it normally
+        if not copied:
+            return False
+        
+        while copied:
+            copied = os.copy_file_range(src_fd, dst_fd, _COPY_RANGE_BLOCK)
+    
+    return True
+
+
+def _hashed(chunks: Iterable[bytes], digest: Any) -> Iterator[bytes]:
+    """Yield ``chunks`` unchanged, feeding each to ``digest`` on the way."""
+    for chunk in chunks:
+        digest.update(chunk)
+        yield chunk
+
+
+def _file_sha256(path: str | Path) -> bytes:
+    """SHA-256 digest of a file's contents, read in large blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb', buffering=0) as f:
+        while chunk := f.read(_WRITE_BUFFER_SIZE):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _open_beside(target: Path) -> tuple[int, str]:
+    """Create a new, uniquely named temp file beside ``target`` for writing.
+    
+    Created with mode 0o666 so the kernel applies the umask, giving the file
+    the permissions a plain open() would (mkstemp always uses 0600).
+    
+    Returns:
+        The open file descriptor and the temp file's path
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    for _ in range(tempfile.TMP_MAX):
+        temp_name = os.path.join(target.parent, f".{target.name}.{os.urandom(4).hex()}.tmp")
+        try:
+            return os.open(temp_name, flags, 0o666), temp_name
+        except FileExistsError:
+            continue
+    raise FileExistsError(errno.EEXIST, "No usable temporary file name found", str(target.parent))
+
+
+def _write_atomic(
+    target: Path,
+    data: bytes | Iterable[bytes],
+    mode: Optional[int] = None,
+    verify: bool = False
+) -> None:
+    """Write ``data`` beside ``target``, then rename it over ``target``.
+    
+    The rename is atomic, so a crash mid-write never leaves a truncated
+    document behind. A symlinked ``target`` is followed, so the file it
+    points to is replaced and the link is kept.
+    
+    Args:
+        target: Destination file; its directory must exist
+        data: Binary data, or an iterable of byte chunks
+        mode: Permission bits for the file (None = what open() would give)
+        verify: Read the temp file back and compare SHA-256 digests before
+                the rename, raising OSError on a mismatch
+    """
+    target = Path(os.path.realpath(target))
+    fd, temp_name = _open_beside(target)
+    digest = hashlib.sha256() if verify else None
+    try:
+        with os.fdopen(fd, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            if isinstance(data, (bytes, bytearray, memoryview)):
+                f.write(data)
+                if digest is not None:
+                    digest.update(data)
+            else:
+                f.writelines(data if digest is None else _hashed(data, digest))
+        
+        # Checked before the rename, so a bad write never replaces the target
+        if digest is not None and _file_sha256(temp_name) != digest.digest():
+            raise OSError(f"Verification failed, written data does not match: {target}")
+        
+        if mode is not None:
+            os.chmod(temp_name, mode)
+        os.replace(temp_name, target)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+
+def _replace_file(source: Path, target: Path) -> None:
+    """Atomically replace ``target`` with ``source``, consuming ``source``.
+    
+    A rename when both are on one filesystem, so no data is copied. Across
+    filesystems, ``source`` is copied to a temp file beside ``target`` and
+    that is renamed into place, so ``target`` is never seen half-written.
+    """
+    try:
+        os.replace(source, target)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    
+    _copy_atomic(source, target, metadata=True)
+    os.unlink(source)
+
+
+def _copy_atomic(source: Path, target: Path, metadata: bool = False) -> None:
+    """Copy ``source`` to a temp file beside ``target``, then rename it over.
+    
+    The data moves kernel-side (see _copy_file) and ``target`` is never seen
+    half-written; a symlinked ``target`` is followed, as in _write_atomic.
+    Without ``metadata`` the copy gets the permissions a plain open() would
+    give it.
+    """
+    target = Path(os.path.realpath(target))
+    fd, temp_name = _open_beside(target)
+    os.close(fd)
+    try:
+        _copy_file(source, Path(temp_name), metadata=metadata)
+        os.replace(temp_name, target)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+
+def _stat_regular_file(path: Path) -> os.stat_result:
+    """Stat ``path``, raising unless it is an existing regular file."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}") from None
+    
+    if not stat.S_ISREG(st.st_mode):
+        raise ValueError(f"Not a file: {path}")
+    return st
 
 
 @dataclass
@@ -72,21 +272,34 @@ class TempFileManager:
         ...     # File will NOT be cleaned up
     """
     
-    def __init__(self, cleanup_on_success: bool = True, cleanup_on_error: bool = True):
+    def __init__(
+        self,
+        cleanup_on_success: bool = True,
+        cleanup_on_error: bool = True,
+        base_dir: Optional[str | Path] = None
+    ):
         """Initialize TempFileManager.
         
         Args:
             cleanup_on_success: Remove temp files if context exits normally
             cleanup_on_error: Remove temp files if exception occurs
+            base_dir: Directory to create the temp directory in (None = the
+                      system temp directory). Use the destination's directory
+                      so finished files can be renamed into place
         """
         self.cleanup_on_success = cleanup_on_success
         self.cleanup_on_error = cleanup_on_error
+        self.base_dir = Path(base_dir) if base_dir is not None else None
         self.temp_dir: Optional[Path] = None
         self.temp_files: list[TempFileInfo] = []
+        self._file_counter = itertools.count(1)
     
     def __enter__(self) -> 'TempFileManager':
         """Enter context and create temp directory."""
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="docx_skill_"))
+        # Hidden when created among the user's files, so one left behind by
+        # a crash does not show up in the document's folder
+        prefix = ".docx_skill_" if self.base_dir is not None else "docx_skill_"
+        self.temp_dir = Path(tempfile.mkdtemp(prefix=prefix, dir=self.base_dir))
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -123,13 +336,16 @@ class TempFileManager:
         if not self.temp_dir:
             raise RuntimeError("TempFileManager not initialized (use with context manager)")
         
-        temp_path = self.temp_dir / f"{uuid.uuid4().hex}_{filename}"
-        temp_path.touch()
+        # The mkdtemp directory is private to this manager, so a counter is
+        # enough to keep names unique
+        temp_path = self.temp_dir / f"{next(self._file_counter):08x}_{filename}"
+        # O_EXCL: one open() creates the file and refuses to reuse a name
+        os.close(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
         
         self.temp_files.append(TempFileInfo(
             path=temp_path,
             original_name=filename,
-            created_at=temp_path.stat().st_ctime
+            created_at=time.time()
         ))
         
         return temp_path
@@ -156,7 +372,10 @@ class TempFileManager:
             raise FileNotFoundError(f"Source file not found: {source}")
         
         temp_path = self.create_temp_file(source.name)
-        shutil.copy2(source, temp_path)
+        
+        # Contents only: the copy is short-lived, so copying timestamps and
+        # permission bits would be wasted chmod/utime calls
+        _copy_file(source, temp_path, metadata=False)
         
         return temp_path
     
@@ -212,21 +431,25 @@ class SafeFileOperations:
     
     def write_file(
         self,
-        data: bytes,
+        data: bytes | Iterable[bytes],
         target_path: str | Path,
         allow_overwrite: Optional[bool] = None,
         confirm_callback: Optional[Callable[[Path], bool]] = None,
-        backup: bool = True
+        backup: bool = True,
+        verify: bool = False
     ) -> Path:
         """Write data to file with overwrite protection.
         
         Args:
-            data: Binary data to write
+            data: Binary data to write, or an iterable of byte chunks that
+                  are written as they are produced
             target_path: Destination file path
             allow_overwrite: Allow overwriting existing file (None = use default)
             confirm_callback: Function to call for overwrite confirmation
                              Should return True to proceed, False to cancel
             backup: Create backup (.bak) if overwriting existing file
+            verify: Read the written file back and compare SHA-256 digests
+                    before it replaces the target
             
         Returns:
             Path to written file
@@ -234,6 +457,7 @@ class SafeFileOperations:
         Raises:
             FileExistsError: If file exists and overwrite not allowed
             ValueError: If user confirms 'no' via callback
+            OSError: If verify is set and the file read back differs
             
         Example:
             >>> ops = SafeFileOperations()
@@ -247,6 +471,23 @@ class SafeFileOperations:
             >>> ops.write_file(data, "exists.docx", confirm_callback=confirm)
         """
         target = Path(target_path)
+        self._check_overwrite(target, allow_overwrite, confirm_callback, backup)
+        
+        # Ensure parent directory exists
+        target.parent.mkdir(parents=True, exist_ok=True)
+        
+        _write_atomic(target, data, verify=verify)
+        
+        return target
+    
+    def _check_overwrite(
+        self,
+        target: Path,
+        allow_overwrite: Optional[bool],
+        confirm_callback: Optional[Callable[[Path], bool]],
+        backup: bool
+    ) -> None:
+        """Enforce overwrite protection for ``target`` and back it up if asked."""
         allow = allow_overwrite if allow_overwrite is not None else self.default_allow_overwrite
         
         # Check if file exists
@@ -265,15 +506,7 @@ class SafeFileOperations:
             # Create backup if requested
             if backup:
                 backup_path = target.with_suffix(target.suffix + '.bak')
-                shutil.copy2(target, backup_path)
-        
-        # Ensure parent directory exists
-        target.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write file
-        target.write_bytes(data)
-        
-        return target
+                _copy_file(target, backup_path)
     
     def read_file(self, source_path: str | Path) -> bytes:
         """Read file with error handling.
@@ -293,14 +526,12 @@ class SafeFileOperations:
             >>> data = ops.read_file("document.docx")
         """
         source = Path(source_path)
+        _stat_regular_file(source)
         
-        if not source.exists():
-            raise FileNotFoundError(f"File not found: {source}")
-        
-        if not source.is_file():
-            raise ValueError(f"Not a file: {source}")
-        
-        return source.read_bytes()
+        # Unbuffered: readall() sizes a single read from fstat, without the
+        # BufferedReader and isatty() probe a default open() sets up
+        with open(source, 'rb', buffering=0) as f:
+            return f.read()
     
     def copy_file(
         self,
@@ -311,6 +542,10 @@ class SafeFileOperations:
     ) -> Path:
         """Copy file with overwrite protection.
         
+        The data is copied kernel-side into a temp file beside the target,
+        which is then renamed into place; it never passes through Python.
+        An overwritten target is backed up to .bak first, as in write_file.
+        
         Args:
             source_path: Source file path
             target_path: Destination file path
@@ -320,12 +555,27 @@ class SafeFileOperations:
         Returns:
             Path to copied file
             
+        Raises:
+            FileNotFoundError: If source file doesn't exist
+            FileExistsError: If target exists and overwrite not allowed
+            ValueError: If source is not a file, or user confirms 'no'
+            
         Example:
             >>> ops = SafeFileOperations()
             >>> ops.copy_file("original.docx", "copy.docx", allow_overwrite=False)
         """
-        data = self.read_file(source_path)
-        return self.write_file(data, target_path, allow_overwrite, confirm_callback)
+        source = Path(source_path)
+        target = Path(target_path)
+        _stat_regular_file(source)
+        
+        self._check_overwrite(target, allow_overwrite, confirm_callback, backup=True)
+        
+        # Ensure parent directory exists
+        target.parent.mkdir(parents=True, exist_ok=True)
+        
+        _copy_atomic(source, target)
+        
+        return target
 
 
 class DocumentTransaction:
@@ -353,13 +603,24 @@ class DocumentTransaction:
         ...         txn.commit()  # Never reached
         ... except ValueError:
         ...     pass  # Original file unchanged due to rollback
+        >>> 
+        >>> # Small documents staged in memory, no temp files
+        >>> import io
+        >>> with DocumentTransaction("doc.docx", in_memory_threshold=4 * 1024 * 1024) as txn:
+        ...     doc = Document(io.BytesIO(txn.get_working_bytes()))
+        ...     doc.add_paragraph("New content")
+        ...     buf = io.BytesIO()
+        ...     doc.save(buf)
+        ...     txn.set_working_bytes(buf.getvalue())
+        ...     txn.commit()
     """
     
     def __init__(
         self,
         document_path: str | Path,
         backup: bool = True,
-        auto_commit: bool = False
+        auto_commit: bool = False,
+        in_memory_threshold: int = 0
     ):
         """Initialize DocumentTransaction.
         
@@ -367,30 +628,82 @@ class DocumentTransaction:
             document_path: Path to document to operate on
             backup: Create backup before committing changes
             auto_commit: Automatically commit on successful exit (default: False)
+            in_memory_threshold: Stage documents smaller than this many bytes
+                                 in memory instead of a temp file (0 = never).
+                                 Pays off with get/set_working_bytes();
+                                 get_working_path() moves them to a temp file
         """
         self.document_path = Path(document_path)
         self.backup = backup
         self.auto_commit = auto_commit
+        self.in_memory_threshold = in_memory_threshold
         self.temp_mgr: Optional[TempFileManager] = None
         self.working_path: Optional[Path] = None
         self.committed = False
         self.backup_path: Optional[Path] = None
+        self._working_data: Optional[bytes] = None  # Set while staged in memory
+        self._mode: Optional[int] = None  # Permission bits of the original
+        self._staging_dir: Optional[Path] = None
+        self._target: Optional[Path] = None  # document_path, symlinks resolved
     
     def __enter__(self) -> 'DocumentTransaction':
         """Enter transaction context."""
-        # Create temp file manager
-        self.temp_mgr = TempFileManager(cleanup_on_success=True, cleanup_on_error=True)
-        self.temp_mgr.__enter__()
+        # Stage and commit against the real file, so a symlinked document
+        # has its target replaced rather than the link
+        self._target = Path(os.path.realpath(self.document_path))
+        
+        # One stat says whether there is a document to copy; if there is,
+        # its directory exists too
+        try:
+            st = os.stat(self._target)
+        except FileNotFoundError:
+            st = None
+        
+        # Stage beside the document when its directory exists, so commit()
+        # is a rename rather than a cross-filesystem copy
+        parent = self._target.parent
+        if st is not None or parent.is_dir():
+            self._staging_dir = parent
+        
+        if st is not None:
+            self._mode = stat.S_IMODE(st.st_mode)
+        
+        # Small documents: one read now, one atomic write on commit
+        size = st.st_size if st is not None else 0
+        if size < self.in_memory_threshold:
+            if st is None:
+                self._working_data = b""
+            else:
+                with open(self._target, 'rb', buffering=0) as f:
+                    self._working_data = f.read()
+            return self
+        
+        self._start_temp_mgr()
         
         # Copy document to temp location
-        if self.document_path.exists():
-            self.working_path = self.temp_mgr.copy_to_temp(self.document_path)
+        if st is not None:
+            self.working_path = self.temp_mgr.copy_to_temp(self._target)
         else:
             # Create new temp file if original doesn't exist
             self.working_path = self.temp_mgr.create_temp_file(self.document_path.name)
         
         return self
     
+    def _start_temp_mgr(self) -> None:
+        """Create and enter the temp file manager for the working copy.
+        
+        Falls back to the system temp directory when the document's
+        directory does not accept new files; commit() then copies the
+        working copy into place instead of renaming it.
+        """
+        try:
+            self.temp_mgr = TempFileManager(base_dir=self._staging_dir).__enter__()
+        except OSError:
+            if self._staging_dir is None:
+                raise
+            self._staging_dir = None
+            self.temp_mgr = TempFileManager().__enter__()
+    
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit transaction context and cleanup."""
         try:
@@ -420,15 +733,47 @@ class DocumentTransaction:
             ...     # Modify file at path...
             ...     txn.commit()
         """
+        if self._working_data is not None:
+            # Staged in memory: move it to a temp file for path-based callers
+            self._start_temp_mgr()
+            self.working_path = self.temp_mgr.create_temp_file(self.document_path.name)
+            self.working_path.write_bytes(self._working_data)
+            self._working_data = None
+        
         if not self.working_path:
             raise RuntimeError("Transaction not initialized (use with context manager)")
         return self.working_path
     
+    def get_working_bytes(self) -> bytes:
+        """Get the contents of the working copy.
+        
+        Returns:
+            Working copy as bytes (empty for a new document)
+        """
+        if self._working_data is not None:
+            return self._working_data
+        return self.get_working_path().read_bytes()
+    
+    def set_working_bytes(self, data: bytes) -> None:
+        """Replace the contents of the working copy.
+        
+        Args:
+            data: New document contents
+        """
+        if self._working_data is not None:
+            self._working_data = bytes(data)
+        else:
+            self.get_working_path().write_bytes(data)
+    
     def commit(self) -> None:
         """Commit changes to original document.
         
-        Copies working copy back to original location. If backup enabled,
-        creates .bak file first.
+        Moves the working copy over the original location in one atomic
+        rename (or, when staged in memory, writes it beside the original
+        and renames), so the original is never left half-written. The
+        working copy is consumed. If it had to be staged in the system temp
+        directory, it is copied over the original instead. If backup
+        enabled, creates .bak file first.
         
         Raises:
             RuntimeError: If transaction not initialized or already committed
@@ -438,22 +783,39 @@ class DocumentTransaction:
             ...     # Make changes...
             ...     txn.commit()  # Writes to original
         """
-        if not self.working_path:
+        if self._working_data is None and not self.working_path:
             raise RuntimeError("Transaction not initialized")
         
         if self.committed:
             raise RuntimeError("Transaction already committed")
         
-        # Create backup if requested and original exists
-        if self.backup and self.document_path.exists():
-            self.backup_path = self.document_path.with_suffix(self.document_path.suffix + '.bak')
-            shutil.copy2(self.document_path, self.backup_path)
-        
-        # Ensure parent directory exists
-        self.document_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Copy working file to original location
-        shutil.copy2(self.working_path, self.document_path)
+        # Create backup if requested and original exists; trying the copy
+        # answers "exists?" without a separate stat
+        if self.backup:
+            backup_path = self.document_path.with_suffix(self.document_path.suffix + '.bak')
+            try:
+                _copy_file(self.document_path, backup_path)
+                self.backup_path = backup_path
+            except FileNotFoundError:
+                pass
+        
+        # Ensure parent directory exists; it did when the transaction started
+        if self._staging_dir is None:
+            self._target.parent.mkdir(parents=True, exist_ok=True)
+        
+        if self._working_data is not None:
+            # Staged in memory: write it beside the original and rename
+            _write_atomic(self._target, self._working_data, mode=self._mode)
+        elif self._staging_dir is None:
+            # Staged in the system temp directory: copy the contents into
+            # place, since the document's directory may not take a rename
+            _copy_file(self.working_path, self._target, metadata=False)
+        else:
+            # Move working file to original location, keeping the original's
+            # permissions (the temp copy was created with default ones)
+            if self._mode is not None:
+                os.chmod(self.working_path, self._mode)
+            _replace_file(self.working_path, self._target)
         
         self.committed = True
     
@@ -507,4 +869,4 @@ class DocumentTransaction:
         if not self.has_backup():
             raise RuntimeError("No backup available to restore")
         
-        shutil.copy2(self.backup_path, self.document_path)
+        _copy_file(self.backup_path, self.document_path)
@@ -29,6 +29,7 @@ Example:
     ...     print(f"Warning: {warning}")
 """
 
+import io
 import zipfile
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -201,7 +202,7 @@ NAMESPACES = {
 }
 
 
-def validate_docx(document_path: str | Path, check_corruption: bool = True) -> ValidationResult:
+def validate_docx(document_path: str | Path | bytes, check_corruption: bool = True) -> ValidationResult:
     """Validate that a file is a valid DOCX document.
     
     Checks:
@@ -212,7 +213,8 @@ def validate_docx(document_path: str | Path, check_corruption: bool = True) -> V
     - Optional: Check for common corruption patterns
     
     Args:
-        document_path: Path to DOCX file
+        document_path: Path to DOCX file, or the DOCX contents as bytes
+            (e.g. a document serialized in memory before it is written)
         check_corruption: Perform deep corruption checks
         
     Returns:
@@ -227,36 +229,42 @@ def validate_docx(document_path: str | Path, check_corruption: bool = True) -> V
         >>> result = validate_docx("document.docx", check_corruption=True)
         >>> print(f"Checked for corruption: {result.is_valid}")
     """
-    result = ValidationResult(validated_path=Path(document_path))
-    path = Path(document_path)
-    
-    # Check file exists
-    if not path.exists():
-        result.add_error(
-            f"File not found: {path}",
-            code="FILE_NOT_FOUND",
-            suggestion="Check the file path"
-        )
-        return result
-    
-    # Check file is readable
-    if not path.is_file():
-        result.add_error(
-            f"Not a file: {path}",
-            code="NOT_A_FILE"
-        )
-        return result
-    
-    # Check file extension
-    if path.suffix.lower() not in ['.docx', '.docm']:
-        result.add_warning(
-            f"Unexpected file extension: {path.suffix}",
-            suggestion="DOCX files should have .docx or .docm extension"
-        )
+    if isinstance(document_path, (bytes, bytearray)):
+        result = ValidationResult()
+        source = io.BytesIO(document_path)
+    else:
+        result = ValidationResult(validated_path=Path(document_path))
+        path = Path(document_path)
+        
+        # Check file exists
+        if not path.exists():
+            result.add_error(
+                f"File not found: {path}",
+                code="FILE_NOT_FOUND",
+                suggestion="Check the file path"
+            )
+            return result
+        
+        # Check file is readable
+        if not path.is_file():
+            result.add_error(
+                f"Not a file: {path}",
+                code="NOT_A_FILE"
+            )
+            return result
+        
+        # Check file extension
+        if path.suffix.lower() not in ['.docx', '.docm']:
+            result.add_warning(
+                f"Unexpected file extension: {path.suffix}",
+                suggestion="DOCX files should have .docx or .docm extension"
+            )
+        
+        source = path
     
     # Check it's a valid ZIP
     try:
-        with zipfile.ZipFile(path, 'r') as zip_ref:
+        with zipfile.ZipFile(source, 'r') as zip_ref:
             # Check for required files
             required_files = [
                 '[Content_Types].xml',
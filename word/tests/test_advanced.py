@@ -65,6 +65,10 @@ class TestAdvancedDocument:
         assert isinstance(doc.sections, SectionManager)
         assert isinstance(doc.tables, TableBuilder)
         assert isinstance(doc.images, ImageManager)
+        
+        # Created once, then reused
+        assert doc.styles is doc.styles
+        assert doc.tables is doc.tables
     
     def test_add_paragraph(self):
         """Test adding paragraph."""
@@ -108,6 +112,26 @@ class TestAdvancedDocument:
         
         assert saved_path == str(output_path)
         assert output_path.exists()
+        # Written directly - no temp file left next to the output
+        assert list(temp_dir.iterdir()) == [output_path]
+    
+    def test_save_validation_only_for_loaded_documents(self, temp_dir, monkeypatch):
+        """Built documents skip validation unless asked; loaded ones validate."""
+        import scripts.advanced as advanced
+        calls = []
+        real_validate = advanced.validate_docx
+        monkeypatch.setattr(advanced, "validate_docx",
+                            lambda data: calls.append(data) or real_validate(data))
+        
+        doc = AdvancedDocument()
+        doc.save(str(temp_dir / "built.docx"))
+        assert calls == []
+        
+        doc.save(str(temp_dir / "checked.docx"), validate=True)
+        assert len(calls) == 1
+        
+        AdvancedDocument(str(temp_dir / "built.docx")).save(str(temp_dir / "loaded.docx"))
+        assert len(calls) == 2
     
     def test_save_overwrite_protection(self, temp_dir):
         """Test save with overwrite protection."""
@@ -139,6 +163,39 @@ class TestAdvancedDocument:
         
         repr_str = repr(doc)
         assert "AdvancedDocument" in repr_str
+        
+        ooxml = doc.get_ooxml_document()
+        doc.tables.create_table(rows=1, cols=1)
+        expected = (f"AdvancedDocument({len(ooxml.get_paragraphs())} paragraphs, "
+                    f"{len(ooxml.get_tables())} tables)")
+        assert repr(doc) == expected
+    
+    def test_build_many(self, temp_dir):
+        """Test building several documents in worker processes."""
+        specs = [
+            {
+                "filename": "first.docx",
+                "paragraphs": ["Plain text", ("Styled text", "Heading 1")],
+            },
+            {
+                "filename": "second.docx",
+                "style": "Heading 2",
+                "paragraphs": ["One", "Two"],
+                "tables": [{"data": [["A", "B"]], "headers": ["X", "Y"]}],
+            },
+        ]
+        
+        paths = AdvancedDocument.build_many(specs, str(temp_dir), workers=2)
+        
+        assert paths == [str(temp_dir / "first.docx"), str(temp_dir / "second.docx")]
+        
+        first = OOXMLDocument.load(temp_dir / "first.docx")
+        assert [p.text for p in first.get_paragraphs()] == ["Plain text", "Styled text"]
+        assert first.get_paragraphs()[1].style.name == "Heading 1"
+        
+        second = OOXMLDocument.load(temp_dir / "second.docx")
+        assert {p.style.name for p in second.get_paragraphs()} == {"Heading 2"}
+        assert len(second.get_tables()) == 1
 
 
 class TestStyleManager:
@@ -183,6 +240,18 @@ class TestStyleManager:
         
         assert style is not None
         assert style.name == "HighlightStyle"
+        assert style.font.size.pt == 12
+        assert str(style.font.color.rgb) == "0000FF"
+    
+    def test_restyle_existing_paragraph_style(self):
+        """Re-adding a style updates it without dropping earlier settings."""
+        doc = AdvancedDocument()
+        doc.styles.add_paragraph_style("Restyled", font_name="Arial", bold=True)
+        style = doc.styles.add_paragraph_style("Restyled", font_size=16)
+        
+        assert style.font.name == "Arial"
+        assert style.font.bold is True
+        assert style.font.size.pt == 16
     
     def test_list_styles(self):
         """Test listing all styles."""
@@ -205,6 +274,30 @@ class TestStyleManager:
         # Try to get non-existent style
         missing = doc.styles.get_style("NonExistentStyle")
         assert missing is None
+        
+        # Styles created here or directly through python-docx are both found
+        created = doc.styles.add_paragraph_style("Created", bold=True)
+        assert doc.styles.get_style("Created") is created
+        
+        from docx.enum.style import WD_STYLE_TYPE
+        doc.get_ooxml_document().document.styles.add_style("External", WD_STYLE_TYPE.PARAGRAPH)
+        assert doc.styles.get_style("External") is not None
+        assert "External" in doc.styles.list_styles()
+    
+    def test_get_style_resolves_like_python_docx(self):
+        """Lowercase built-in names and renamed styles resolve as styles[name] does."""
+        doc = AdvancedDocument()
+        
+        heading = doc.styles.get_style("heading 1")
+        assert heading is not None
+        assert heading.name == "Heading 1"
+        assert doc.styles.add_paragraph_style("heading 1", bold=True).name == "Heading 1"
+        
+        style = doc.styles.add_paragraph_style("Before", bold=True)
+        style.name = "After"
+        assert doc.styles.get_style("After").name == "After"
+        assert "After" in doc.styles.list_styles()
+        assert "Before" not in doc.styles.list_styles()
     
     def test_use_custom_style(self, temp_dir):
         """Test using custom style in document."""
@@ -265,6 +358,18 @@ class TestSectionManager:
         assert abs(section.left_margin.inches - 1.5) < 0.01
         assert abs(section.right_margin.inches - 1.5) < 0.01
     
+    def test_set_margins_after_add_section(self):
+        """Margins set after add_section apply to the new last section."""
+        doc = AdvancedDocument()
+        doc.sections.set_margins(top=1.0, bottom=1.0, left=1.0, right=1.0)
+        doc.add_paragraph("Page 1")
+        doc.sections.add_section()
+        doc.sections.set_margins(top=0.5, bottom=0.5, left=0.5, right=0.5)
+        
+        first, last = doc.get_ooxml_document().get_sections()
+        assert abs(first.top_margin.inches - 1.0) < 0.01
+        assert abs(last.top_margin.inches - 0.5) < 0.01
+    
     def test_add_section_portrait(self):
         """Test adding portrait section."""
         doc = AdvancedDocument()
@@ -313,6 +418,21 @@ class TestSectionManager:
         footer_text = section.footer.paragraphs[0].text
         
         assert "Page Footer" in footer_text
+    
+    def test_replace_header_keeps_run_formatting(self):
+        """Re-setting a header replaces its text but keeps the run's formatting."""
+        doc = AdvancedDocument()
+        doc.sections.add_header("First")
+        header = doc.get_ooxml_document().get_sections()[0].header
+        header.paragraphs[0].runs[0].bold = True
+        header.paragraphs[0].add_run(" extra")
+        
+        doc.sections.add_header("Second")
+        
+        runs = header.paragraphs[0].runs
+        assert header.paragraphs[0].text == "Second"
+        assert len(runs) == 1
+        assert runs[0].bold is True
 
 
 class TestTableBuilder:
@@ -356,6 +476,26 @@ class TestTableBuilder:
         assert len(table.rows) == 3
         assert table.rows[0].cells[0].text == "Col1"
         assert table.rows[1].cells[0].text == "1"
+        
+        # Header runs are bold, data runs are not
+        assert table.rows[0].cells[1].paragraphs[0].runs[0].bold is True
+        assert table.rows[1].cells[1].paragraphs[0].runs[0].bold is None
+        # One paragraph per cell, as with cell.text
+        assert len(table.rows[2].cells[1].paragraphs) == 1
+    
+    def test_add_table_from_ragged_data(self):
+        """Test that rows or headers wider than the first row keep every cell."""
+        doc = AdvancedDocument()
+        
+        table = doc.tables.add_table_from_data(
+            [["1"], ["2", "3", "4"]],
+            headers=["A", "B"]
+        )
+        
+        assert len(table.columns) == 3
+        assert [cell.text for cell in table.rows[0].cells] == ["A", "B", ""]
+        assert [cell.text for cell in table.rows[1].cells] == ["1", "", ""]
+        assert [cell.text for cell in table.rows[2].cells] == ["2", "3", "4"]
     
     def test_add_table_with_style(self):
         """Test creating table with style."""
@@ -380,6 +520,12 @@ class TestTableBuilder:
         assert isinstance(styles, list)
         # Should have some table styles
         assert len(styles) > 0
+        
+        # Callers get their own copy; new table styles show up
+        styles.clear()
+        from docx.enum.style import WD_STYLE_TYPE
+        doc.get_ooxml_document().document.styles.add_style("MyTable", WD_STYLE_TYPE.TABLE)
+        assert "MyTable" in doc.tables.list_table_styles()
 
 
 class TestImageManager:
@@ -90,8 +90,15 @@ def test_ooxml_document_loading():
         text = loaded_doc.get_text()
         assert "Test Document" in text
         assert "First paragraph" in text
+        assert text == "\n".join(p.text for p in loaded_doc.get_paragraphs())
         print(f"  ✓ Text extracted ({len(text)} characters)")
         
+        # Tabs and line breaks come through as python-docx reports them
+        run = loaded_doc.add_paragraph("a\tb").add_run("c")
+        run.add_break()
+        run.add_text("d")
+        assert loaded_doc.get_text().endswith("\na\tbc\nd")
+        
         # Test word count
         print("\nTest 4: Get word count")
         word_count = loaded_doc.get_word_count()
@@ -138,6 +145,12 @@ def test_ooxml_document_access():
         assert len(tables) == 1
         print(f"  ✓ Found {len(tables)} table(s)")
         
+        # Lazy iteration yields the same wrappers
+        assert [t._tbl for t in doc.iter_tables()] == [t._tbl for t in tables]
+        assert [p.text for p in doc.iter_paragraphs()] == [p.text for p in doc.get_paragraphs()]
+        assert next(doc.iter_paragraphs()).text == "Document with Table"
+        print("  ✓ iter_tables/iter_paragraphs match")
+        
         # Test getting sections
         print("\nTest 3: Get sections")
         sections = doc.get_sections()
@@ -155,8 +168,18 @@ def test_ooxml_document_access():
         paragraphs = doc.find_elements('p')
         print(f"  Found {len(paragraphs)} paragraph elements")
         assert len(paragraphs) > 0
+        assert list(doc.iter_elements('p')) == paragraphs
+        assert next(doc.iter_elements('tbl')) is doc.find_elements('tbl')[0]
         print("  ✓ Elements found via XPath")
         
+        # Test single-pass index over several tags
+        print("\nTest 6: Index several tags at once")
+        index = doc.index_elements('p', 'tbl', 'tc')
+        assert index['p'] == paragraphs
+        assert index['tbl'] == doc.find_elements('tbl')
+        assert len(index['tc']) == 4
+        print("  ✓ Index matches find_elements")
+        
         print("\n✓ All element access tests passed!")
         
     finally:
@@ -239,6 +262,16 @@ def test_ooxml_utilities():
         assert len(all_paras) == 2
         print(f"  ✓ Found {len(all_paras)} paragraph elements")
         
+        # Test multi-step paths (compiled once, reused on repeat calls)
+        print("\nTest 4: Multi-step paths")
+        for _ in range(2):
+            texts = get_xml_elements(body, './/w:p/w:r/w:t')
+            assert [t.text for t in texts] == ["Test paragraph 1", "Test paragraph 2"]
+        assert get_xml_element(body, './/w:tbl') is None
+        assert len(get_xml_elements(body, 'w:p')) == 2
+        assert len(get_xml_elements(body, 'descendant::w:r/w:t')) == 2
+        print("  ✓ Multi-step paths resolved")
+        
         print("\n✓ All utility tests passed!")
         
     finally:
@@ -263,9 +296,15 @@ def test_ooxml_clear_content():
         print(f"  Initial paragraphs: {initial_count}")
         assert initial_count == 4
         
+        doc.get_sections()[0].left_margin = 914400
+        
         # Clear content
         doc.clear_content()
         
+        # Page setup survives the clear
+        assert len(doc.get_sections()) == 1
+        assert doc.get_sections()[0].left_margin == 914400
+        
         # Add new content
         doc.add_paragraph("Fresh start")
         
@@ -0,0 +1,96 @@
+"""
+Tests for scripts/__init__.py - Package exports
+
+Tests cover:
+- Lazy (PEP 562) loading of submodules
+- Public API exports
+"""
+
+import pytest
+from pathlib import Path
+import subprocess
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import scripts
+
+PACKAGE_ROOT = str(Path(__file__).parent.parent)
+
+
+def _run(code: str) -> str:
+    """Run code in a fresh interpreter so module import state is clean."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PACKAGE_ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+class TestLazyExports:
+    """Test that submodules load on first access."""
+    
+    def test_import_loads_no_submodules(self):
+        """Importing the package alone imports none of its submodules."""
+        out = _run(
+            "import sys, scripts; "
+            "print(sorted(m for m in sys.modules if m.startswith('scripts.')))"
+        )
+        assert out == "[]"
+    
+    def test_access_loads_only_owning_submodule(self):
+        """Accessing a name imports just the submodule that defines it."""
+        out = _run(
+            "import sys, scripts; scripts.TempFileManager; "
+            "print('scripts.safety' in sys.modules, 'scripts.advanced' in sys.modules)"
+        )
+        assert out == "True False"
+    
+    def test_all_names_resolve(self):
+        """Every name in __all__ resolves to its submodule's object."""
+        for name in scripts.__all__:
+            assert getattr(scripts, name) is not None
+        
+        from scripts.simple import DocumentBuilder
+        assert scripts.DocumentBuilder is DocumentBuilder
+    
+    def test_submodule_attribute(self):
+        """Submodules are reachable as attributes before being imported."""
+        out = _run("import scripts; print(scripts.router.__name__)")
+        assert out == "scripts.router"
+    
+    def test_lazy_imports_covers_all_exports(self):
+        """__lazy_imports__ lists every exported name with its submodule."""
+        names = [name for _, names in scripts.__lazy_imports__ for name in names]
+        assert sorted(names) == sorted(scripts.__all__)
+    
+    def test_recommend_api_is_memoized(self):
+        """Repeated router queries return the cached Recommendation."""
+        scripts.recommend_api.cache_clear()
+        first = scripts.recommend_api("Create document with custom styles")
+        second = scripts.recommend_api("Create document with custom styles")
+        
+        assert first is second
+        assert scripts.recommend_api.cache_info().hits == 1
+    
+    def test_recommend_api_cache_shared_with_router(self):
+        """The package export is the router's own memoized function."""
+        from scripts import router
+        
+        assert scripts.recommend_api is router.recommend_api
+    
+    def test_unknown_name_raises_attribute_error(self):
+        """Unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            scripts.does_not_exist
+    
+    def test_dir_lists_exports(self):
+        """dir() includes names that have not been loaded yet."""
+        assert set(scripts.__all__) <= set(dir(scripts))
+    
+    def test_star_import(self):
+        """from scripts import * binds every exported name."""
+        namespace = {}
+        exec("from scripts import *", namespace)
+        assert set(scripts.__all__) <= set(namespace)
@@ -8,6 +8,7 @@ Tests cover:
 - Recommendation quality
 """
 
+import dataclasses
 import pytest
 from pathlib import Path
 import sys
@@ -17,10 +18,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scripts.router import (
     recommend_api,
+    recommend_api_batch,
     should_use_simple_api,
     should_use_advanced_api,
     should_use_ooxml_api,
     Recommendation,
+    Requirement,
     _extract_requirements,
 )
 
@@ -34,13 +37,21 @@ class TestRecommendationDataclass:
             api_level="simple",
             reasoning="Test reasoning",
             example_code="print('hello')",
-            alternatives=["Alt 1", "Alt 2"]
+            alternatives=("Alt 1", "Alt 2")
         )
         
         assert rec.api_level == "simple"
         assert rec.reasoning == "Test reasoning"
         assert "hello" in rec.example_code
         assert len(rec.alternatives) == 2
+    
+    def test_recommendation_is_immutable(self):
+        """Test that shared Recommendations cannot be modified."""
+        rec = recommend_api("Create document with custom styles")
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            rec.api_level = "ooxml"
+        assert not hasattr(rec, "__dict__")
 
 
 class TestRequirementExtraction:
@@ -104,6 +115,20 @@ class TestRequirementExtraction:
         req = _extract_requirements(desc)
         
         assert req["xml_manipulation"] is True
+    
+    def test_extract_overlapping_keywords(self):
+        """Test that keywords nested in longer keywords are all reported."""
+        req = _extract_requirements("apply a table style and a paragraph style")
+        
+        assert req["advanced_tables"] is True
+        assert req["tables"] is True
+        assert req["custom_styles"] is True
+        assert req["paragraphs"] is True
+        
+        req = _extract_requirements("listable")
+        assert req["lists"] is True
+        assert req["tables"] is True
+        assert req["headings"] is False
 
 
 class TestDecisionFunctions:
@@ -175,6 +200,22 @@ class TestDecisionFunctions:
         }
         
         assert should_use_ooxml_api(req) is True
+    
+    def test_decision_functions_accept_mask(self):
+        """Test decision functions with a Requirement mask."""
+        req = Requirement.HEADINGS | Requirement.CUSTOM_STYLES
+        
+        assert should_use_simple_api(req) is False
+        assert should_use_advanced_api(req) is True
+        assert should_use_ooxml_api(req) is False
+        
+        req |= Requirement.XML_MANIPULATION
+        assert should_use_advanced_api(req) is False
+        assert should_use_ooxml_api(req) is True
+        
+        assert req["custom_styles"] is True
+        assert req.get("lists") is False
+        assert req.get("unknown", "default") == "default"
 
 
 class TestRecommendApi:
@@ -235,6 +276,23 @@ class TestRecommendApi:
         assert "OOXMLDocument" in rec.example_code
         assert "xml" in rec.reasoning.lower()
     
+    def test_advanced_recommendations_are_shared(self):
+        """Test that descriptions with the same advanced features share a result."""
+        first = recommend_api("custom style with a heading")
+        second = recommend_api("a table and a custom style")
+        other = recommend_api("custom style and landscape orientation")
+        
+        assert first is second
+        assert other is not first
+        assert "page layout control" in other.reasoning
+    
+    def test_recommend_trivial_descriptions(self):
+        """Test fast paths for empty descriptions and XML mentions."""
+        assert recommend_api("").api_level == "simple"
+        assert recommend_api("  ").api_level == "simple"
+        assert recommend_api("XML").api_level == "ooxml"
+        assert recommend_api("custom style, edit the xml").api_level == "ooxml"
+    
     def test_recommend_ooxml_low_level(self):
         """Test recommending OOXML API for low-level access."""
         rec = recommend_api("Direct manipulation of ooxml elements")
@@ -272,7 +330,7 @@ class TestRecommendApi:
         """Test all recommendations include alternatives."""
         rec = recommend_api("Create document")
         
-        assert isinstance(rec.alternatives, list)
+        assert isinstance(rec.alternatives, tuple)
         assert len(rec.alternatives) > 0
     
     def test_complex_task_routing(self):
@@ -319,5 +377,28 @@ class TestEdgeCases:
         assert rec1.api_level == rec2.api_level
 
 
+class TestRecommendApiBatch:
+    """Test recommend_api_batch function."""
+    
+    def test_batch_matches_single_calls(self):
+        """Test batch results match recommend_api, in input order."""
+        tasks = [
+            "Add a table",
+            "Use landscape pages",
+            "Edit the XML",
+            "Add a table",
+        ]
+        recs = recommend_api_batch(tasks)
+        
+        assert [rec.api_level for rec in recs] == ["simple", "advanced", "ooxml", "simple"]
+        assert recs == [recommend_api(task) for task in tasks]
+        assert recs[0] is recs[3]
+    
+    def test_batch_empty(self):
+        """Test empty batch."""
+        assert recommend_api_batch([]) == []
+        assert recommend_api_batch(iter([])) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,13 +4,14 @@ Test suite for safety.py module
 Tests TempFileManager, SafeFileOperations, and DocumentTransaction
 """
 
+import os
 import sys
 from pathlib import Path
 
 # Add parent directory to path to import docx_skill
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from scripts.safety import TempFileManager, SafeFileOperations, DocumentTransaction
+from scripts.safety import TempFileManager, SafeFileOperations, DocumentTransaction, _copy_file
 import tempfile
 import shutil
 
@@ -30,6 +31,11 @@ def test_temp_file_manager():
         # Write some data
         temp_path.write_text("test content")
         assert temp_path.read_text() == "test content"
+        
+        # Same name twice still gives distinct files
+        other_path = temp_mgr.create_temp_file("test.docx")
+        assert other_path != temp_path and other_path.exists()
+        assert temp_path.read_text() == "test content"
     
     # After context, file should be cleaned up
     assert not temp_path.exists(), "Temp file should be cleaned up after context"
@@ -100,6 +106,11 @@ def test_safe_file_operations():
         print(f"  Wrote file: {target}")
         assert target.exists()
         assert target.read_bytes() == data
+        # Written via temp file + rename: no leftovers, normal permissions
+        assert list(temp_dir.iterdir()) == [target]
+        umask = os.umask(0)
+        os.umask(umask)
+        assert target.stat().st_mode & 0o777 == 0o666 & ~umask
         print("  ✓ Write successful")
         
         # Test overwrite protection
@@ -120,19 +131,58 @@ def test_safe_file_operations():
         assert backup_path.read_bytes() == b"test content"
         print(f"  ✓ Overwrite successful, backup created: {backup_path}")
         
+        # Test chunked write
+        print("\nTest 4: Write from an iterable of chunks")
+        chunked = temp_dir / "chunked.txt"
+        ops.write_file((part for part in (b"first ", b"second")), chunked)
+        assert chunked.read_bytes() == b"first second"
+        ops.write_file(iter([b"a" * 100_000, b"b"]), chunked, allow_overwrite=True,
+                       backup=False, verify=True)
+        assert chunked.read_bytes() == b"a" * 100_000 + b"b"
+        chunked.unlink()
+        print("  ✓ Chunked write successful")
+        
         # Test read file
-        print("\nTest 4: Read file")
+        print("\nTest 5: Read file")
         content = ops.read_file(target)
         assert content == b"new content"
+        for bad, error in ((temp_dir / "missing.txt", FileNotFoundError), (temp_dir, ValueError)):
+            try:
+                ops.read_file(bad)
+                assert False, f"Should have raised {error.__name__}"
+            except error:
+                pass
         print("  ✓ Read successful")
         
         # Test copy file
-        print("\nTest 5: Copy file")
+        print("\nTest 6: Copy file")
         copy_target = temp_dir / "copy.txt"
         ops.copy_file(target, copy_target, allow_overwrite=False)
         assert copy_target.read_bytes() == b"new content"
+        assert list(temp_dir.glob(".*.tmp")) == []
+        try:
+            ops.copy_file(target, copy_target, allow_overwrite=False)
+            assert False, "Should have raised FileExistsError"
+        except FileExistsError:
+            pass
+        target.write_bytes(b"newer content")
+        ops.copy_file(target, copy_target, allow_overwrite=True)
+        assert copy_target.read_bytes() == b"newer content"
+        assert copy_target.with_suffix(".txt.bak").read_bytes() == b"new content"
         print(f"  ✓ Copy successful: {copy_target}")
         
+        # Test write through a symlink
+        print("\nTest 7: Write through a symlink")
+        link = temp_dir / "link.txt"
+        link.symlink_to(target)
+        ops.write_file(b"via link", link, allow_overwrite=True, backup=False)
+        assert link.is_symlink()
+        assert target.read_bytes() == b"via link"
+        ops.copy_file(copy_target, link, allow_overwrite=True)
+        assert link.is_symlink()
+        assert target.read_bytes() == b"newer content"
+        print("  ✓ Symlink kept, its target replaced")
+        
         print("\n✓ All SafeFileOperations tests passed!")
         
     finally:
@@ -155,6 +205,9 @@ def test_document_transaction():
         with DocumentTransaction(test_file, backup=True) as txn:
             working_path = txn.get_working_path()
             print(f"  Working on: {working_path}")
+            # Staged beside the document so commit can rename it into place
+            assert working_path.parent.parent == temp_dir
+            assert working_path.parent.name.startswith(".")
             
             # Modify working copy
             working_path.write_text("modified content")
@@ -211,6 +264,87 @@ def test_document_transaction():
         
         assert new_file.exists()
         assert new_file.read_text() == "new file content"
+        assert sorted(p.name for p in temp_dir.iterdir()) == [
+            "document.txt", "document.txt.bak", "new_document.txt"
+        ]
+        
+        nested_file = temp_dir / "nested" / "document.txt"
+        with DocumentTransaction(nested_file) as txn:
+            txn.get_working_path().write_text("nested content")
+            txn.commit()
+        
+        assert nested_file.read_text() == "nested content"
+        assert not txn.has_backup()
+        
+        # Test in-memory staging
+        print("\nTest 5: Small document staged in memory")
+        os.chmod(test_file, 0o600)
+        before = sorted(temp_dir.iterdir())
+        
+        with DocumentTransaction(test_file, in_memory_threshold=1024) as txn:
+            assert txn.temp_mgr is None
+            assert txn.get_working_bytes() == test_file.read_bytes()
+            txn.set_working_bytes(b"in-memory content")
+            assert sorted(temp_dir.iterdir()) == before
+            txn.commit()
+        
+        assert test_file.read_bytes() == b"in-memory content"
+        assert test_file.stat().st_mode & 0o777 == 0o600
+        assert backup_path.read_text() == "modified content"
+        assert sorted(temp_dir.iterdir()) == before
+        
+        # Path-based callers still get a working file
+        with DocumentTransaction(test_file, in_memory_threshold=1024) as txn:
+            working_path = txn.get_working_path()
+            assert working_path.read_bytes() == b"in-memory content"
+            working_path.write_bytes(b"spilled content")
+            assert txn.get_working_bytes() == b"spilled content"
+            txn.commit()
+        
+        assert test_file.read_bytes() == b"spilled content"
+        
+        # Permissions survive a file-staged commit too
+        with DocumentTransaction(test_file) as txn:
+            txn.get_working_path().write_bytes(b"file content")
+            txn.commit()
+        
+        assert test_file.read_bytes() == b"file content"
+        assert test_file.stat().st_mode & 0o777 == 0o600
+        
+        # A symlinked document keeps its link; the target is replaced
+        link = temp_dir / "link.txt"
+        link.symlink_to(test_file)
+        for threshold in (0, 1024):
+            with DocumentTransaction(link, backup=False, in_memory_threshold=threshold) as txn:
+                txn.set_working_bytes(b"via link %d" % threshold)
+                txn.commit()
+            
+            assert link.is_symlink()
+            assert test_file.read_bytes() == b"via link %d" % threshold
+        link.unlink()
+        
+        # A directory that takes no new files: stage in the system temp dir
+        mkdtemp = tempfile.mkdtemp
+        
+        def refuse_beside(prefix=None, dir=None):
+            if dir is not None:
+                raise PermissionError(13, "Permission denied", str(dir))
+            return mkdtemp(prefix=prefix)
+        
+        tempfile.mkdtemp = refuse_beside
+        try:
+            with DocumentTransaction(test_file, backup=False) as txn:
+                working_path = txn.get_working_path()
+                assert working_path.parent.parent == Path(tempfile.gettempdir())
+                working_path.write_bytes(b"copied content")
+                txn.commit()
+        finally:
+            tempfile.mkdtemp = mkdtemp
+        
+        assert test_file.read_bytes() == b"copied content"
+        assert test_file.stat().st_mode & 0o777 == 0o600
+        assert not working_path.parent.exists()
+        print("  ✓ In-memory transaction successful")
         print("  ✓ New file transaction successful")
         
         print("\n✓ All DocumentTransaction tests passed!")
@@ -219,6 +353,50 @@ def test_document_transaction():
         shutil.rmtree(temp_dir)
 
 
+def test_copy_file():
+    """Test the kernel-side file copy helper."""
+    print("\n=== Testing _copy_file ===")
+    
+    temp_dir = Path(tempfile.mkdtemp())
+    
+    try:
+        print("Test 1: Copy contents and metadata")
+        source = temp_dir / "source.docx"
+        source.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+        os.utime(source, (1_000_000_000, 1_000_000_000))
+        target = temp_dir / "target.docx"
+        target.write_bytes(b"stale content that is longer than nothing")
+        
+        _copy_file(source, target)
+        assert target.read_bytes() == source.read_bytes()
+        assert target.stat().st_mtime == 1_000_000_000
+        print("  ✓ Contents and mtime copied")
+        
+        print("\nTest 2: Copy empty file")
+        empty = temp_dir / "empty.docx"
+        empty.touch()
+        _copy_file(empty, target, metadata=False)
+        assert target.read_bytes() == b""
+        print("  ✓ Empty file copied")
+        
+        print("\nTest 3: Refuse to copy a file onto itself")
+        link = temp_dir / "link.docx"
+        os.link(source, link)
+        data = source.read_bytes()
+        try:
+            _copy_file(source, link)
+            assert False, "Should have raised SameFileError"
+        except shutil.SameFileError:
+            pass
+        assert source.read_bytes() == data
+        print("  ✓ Source left intact")
+        
+        print("\n✓ All _copy_file tests passed!")
+        
+    finally:
+        shutil.rmtree(temp_dir)
+
+
 def run_all_tests():
     """Run all safety tests."""
     print("=" * 60)
@@ -229,6 +407,7 @@ def run_all_tests():
         test_temp_file_manager()
         test_safe_file_operations()
         test_document_transaction()
+        test_copy_file()
         
         print("\n" + "=" * 60)
         print("✓ ALL SAFETY TESTS PASSED!")
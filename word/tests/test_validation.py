@@ -131,6 +131,16 @@ def test_validate_docx():
         assert result.is_valid
         print("  ✓ Deep validation passed")
         
+        # Test in-memory DOCX bytes
+        print("\nTest 5: DOCX bytes")
+        result = validate_docx(valid_doc.read_bytes())
+        assert result.is_valid
+        assert result.validated_path is None
+        
+        result = validate_docx(b"Not a DOCX file")
+        assert not result.is_valid
+        print("  ✓ Validated in-memory bytes")
+        
         print("\n✓ All validate_docx tests passed!")
         
     finally: